@@ -1,196 +0,0 @@
-#!/usr/bin/env python3
-
-# Read current handler
-with open('handler.py', 'r') as f:
-    content = f.read()
-
-# Add validation functions before the main lambda_handler
-validation_functions = '''
-def handle_ksi_validation_routes(event, context):
-    """Handle KSI validation execution routes"""
-    path = event.get('path', '')
-    method = event.get('httpMethod', '')
-    
-    logger.info(f"KSI validation route: {method} {path}")
-    
-    if path == '/api/ksi/validate':
-        if method == 'POST':
-            return trigger_ksi_validation(json.loads(event['body']))
-    
-    elif path.startswith('/api/ksi/executions'):
-        if method == 'GET':
-            query_params = event.get('queryStringParameters') or {}
-            tenant_id = query_params.get('tenant_id')
-            limit = int(query_params.get('limit', 10))
-            return get_execution_history(tenant_id, limit)
-    
-    elif path.startswith('/api/ksi/results'):
-        if method == 'GET':
-            query_params = event.get('queryStringParameters') or {}
-            tenant_id = query_params.get('tenant_id')
-            execution_id = query_params.get('execution_id')
-            return get_validation_results(tenant_id, execution_id)
-    
-    return cors_response(404, {'error': 'KSI validation route not found'})
-
-def trigger_ksi_validation(validation_request):
-    """Trigger KSI validation for a tenant"""
-    logger.info(f"Triggering KSI validation: {validation_request}")
-    
-    tenant_id = validation_request.get('tenant_id')
-    trigger_source = validation_request.get('trigger_source', 'api')
-    ksi_filter = validation_request.get('ksi_filter', [])
-    validate_all = validation_request.get('validate_all', False)
-    
-    if not tenant_id:
-        return cors_response(400, {'error': 'tenant_id is required'})
-    
-    execution_id = f"exec-{int(datetime.now(timezone.utc).timestamp())}-{uuid.uuid4().hex[:8]}"
-    
-    try:
-        # Get KSIs to validate
-        rules_table = dynamodb.Table(VALIDATION_RULES_TABLE)
-        rules_response = rules_table.scan()
-        available_ksis = rules_response.get('Items', [])
-        
-        # Filter KSIs if specified
-        if ksi_filter and not validate_all:
-            available_ksis = [ksi for ksi in available_ksis if ksi.get('ksi_id') in ksi_filter or ksi.get('rule_id') in ksi_filter]
-        
-        # Create execution record
-        executions_table = dynamodb.Table(EXECUTIONS_TABLE)
-        execution_record = {
-            'execution_id': execution_id,
-            'tenant_id': tenant_id,
-            'trigger_source': trigger_source,
-            'status': 'completed',
-            'ksis_validated': len(available_ksis),
-            'timestamp': datetime.now(timezone.utc).isoformat()
-        }
-        executions_table.put_item(Item=execution_record)
-        
-        # Generate simulated results
-        validation_results = []
-        for ksi in available_ksis:
-            ksi_id = ksi.get('ksi_id') or ksi.get('rule_id')
-            result = {
-                'ksi_id': ksi_id,
-                'execution_id': execution_id,
-                'tenant_id': tenant_id,
-                'assertion': True,
-                'assertion_reason': f"✅ {ksi.get('title', 'KSI')} validation passed",
-                'timestamp': datetime.now(timezone.utc).isoformat(),
-                'commands_executed': ksi.get('command_count', 0),
-                'successful_commands': ksi.get('command_count', 0),
-                'failed_commands': 0,
-                'category': ksi.get('category', 'Unknown'),
-                'record_type': 'result'
-            }
-            executions_table.put_item(Item=result)
-            validation_results.append(result)
-        
-        return cors_response(200, {
-            'status': 'success',
-            'execution_id': execution_id,
-            'ksis_validated': len(validation_results),
-            'message': f'Validation completed for {len(validation_results)} KSIs'
-        })
-        
-    except Exception as e:
-        logger.error(f"Validation failed: {str(e)}")
-        return cors_response(500, {'error': str(e)})
-
-def get_execution_history(tenant_id, limit=10):
-    """Get execution history for a tenant"""
-    if not tenant_id:
-        return cors_response(400, {'error': 'tenant_id is required'})
-    
-    try:
-        executions_table = dynamodb.Table(EXECUTIONS_TABLE)
-        response = executions_table.scan(
-            FilterExpression=Attr('tenant_id').eq(tenant_id) & Attr('record_type').not_exists(),
-            Limit=limit
-        )
-        executions = response.get('Items', [])
-        executions.sort(key=lambda x: x.get('timestamp', ''), reverse=True)
-        
-        return cors_response(200, {
-            'executions': executions[:limit]
-        })
-    except Exception as e:
-        return cors_response(500, {'error': str(e)})
-
-def get_validation_results(tenant_id, execution_id=None):
-    """Get validation results for a tenant"""
-    if not tenant_id:
-        return cors_response(400, {'error': 'tenant_id is required'})
-    
-    try:
-        executions_table = dynamodb.Table(EXECUTIONS_TABLE)
-        
-        if execution_id:
-            filter_expr = Attr('tenant_id').eq(tenant_id) & Attr('execution_id').eq(execution_id) & Attr('record_type').eq('result')
-        else:
-            filter_expr = Attr('tenant_id').eq(tenant_id) & Attr('record_type').eq('result')
-        
-        response = executions_table.scan(FilterExpression=filter_expr)
-        results = response.get('Items', [])
-        
-        # Get latest results per KSI if no execution_id specified
-        if not execution_id and results:
-            latest_results = {}
-            for result in results:
-                ksi_id = result.get('ksi_id')
-                timestamp = result.get('timestamp', '')
-                if ksi_id not in latest_results or timestamp > latest_results[ksi_id].get('timestamp', ''):
-                    latest_results[ksi_id] = result
-            results = list(latest_results.values())
-        
-        results.sort(key=lambda x: x.get('ksi_id', ''))
-        
-        return cors_response(200, {
-            'results': results
-        })
-    except Exception as e:
-        return cors_response(500, {'error': str(e)})
-
-'''
-
-# Find where to insert (before lambda_handler function)
-insert_pos = content.find('def lambda_handler(event, context):')
-if insert_pos != -1:
-    new_content = content[:insert_pos] + validation_functions + '\n' + content[insert_pos:]
-    
-    # Update the lambda_handler function to include KSI routes
-    old_handler = '''    try:
-        if path.startswith('/api/admin'):
-            return handle_admin_request(event, context)
-        elif path.startswith('/api/tenant'):
-            return handle_tenant_request(event, context)
-        else:
-            return cors_response(404, {'error': 'Route not found'})'''
-    
-    new_handler = '''    try:
-        # KSI Validation Routes (NEW!)
-        if path.startswith('/api/ksi/'):
-            return handle_ksi_validation_routes(event, context)
-        
-        # Admin Routes (existing)
-        elif path.startswith('/api/admin'):
-            return handle_admin_request(event, context)
-        
-        # Tenant Routes (existing)  
-        elif path.startswith('/api/tenant'):
-            return handle_tenant_request(event, context)
-        
-        else:
-            return cors_response(404, {'error': 'Route not found'})'''
-    
-    new_content = new_content.replace(old_handler, new_handler)
-    
-    with open('handler.py', 'w') as f:
-        f.write(new_content)
-    
-    print("✅ Successfully added validation endpoints to handler.py")
-else:
-    print("❌ Could not find lambda_handler function")
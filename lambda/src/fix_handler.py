@@ -0,0 +1,377 @@
+#!/usr/bin/env python3
+"""Apply every handler.py patch in one pass: parse once, splice at AST-located lines, write once"""
+import ast
+
+# Frontend camelCase -> backend snake_case mapping, inserted above the onboarding step handler
+STEP_FIELD_MAP_CODE = '''
+# Frontend camelCase field -> backend snake_case field, per onboarding step
+STEP_FIELD_MAP = {
+    4: {'crossAccountRoleArn': 'cross_account_role_arn', 'role_arn': 'cross_account_role_arn', 'externalId': 'external_id'},
+    5: {
+        'fedrampLevel': 'fedramp_level',
+        'currentStatus': 'current_status',
+        'targetAuthorizationDate': 'target_authorization_date',
+        'authorizationBoundary': 'authorization_boundary'
+    },
+    6: {
+        'validationFrequency': 'validation_frequency',
+        'notificationEmail': 'notification_email',
+        'additionalEmails': 'additional_emails',
+        'reportFormat': 'report_format',
+        'slackWebhook': 'slack_webhook'
+    }
+}
+_MISSING = object()
+
+def map_step_fields(step_number, source, target):
+    """Copy each frontend field of a step from source to its backend name in target, keeping both names"""
+    for camel, snake in STEP_FIELD_MAP.get(step_number, {}).items():
+        value = source.get(camel, _MISSING)
+        if value is not _MISSING:
+            target[snake] = value
+
+'''
+
+# Step 4 IAM role mapping (was fix_step4_mapping.py)
+STEP4_CODE = '''elif step_number == 4:
+        # IAM Role Configuration - handle both camelCase (frontend) and snake_case (backend)
+        tenant['iam_role_config'].update(step_payload)
+        map_step_fields(4, step_payload, tenant['aws_accounts'])
+        logger.info("Step 4 aws_accounts after update: %s", tenant['aws_accounts'])'''
+
+# Step 5/6 field mappings (was fix_all_field_mappings.py)
+STEP5_CODE = '''elif step_number == 5:
+        # Compliance Profile - handle both camelCase (frontend) and snake_case (backend)
+        map_step_fields(5, step_payload, step_payload)
+        tenant['compliance'].update(step_payload)
+        logger.info("Step 5 compliance data saved: %s", tenant['compliance'])'''
+
+STEP6_CODE = '''elif step_number == 6:
+        # Preferences - handle both camelCase (frontend) and snake_case (backend)
+        map_step_fields(6, step_payload, step_payload)
+        tenant['preferences'].update(step_payload)
+        logger.info("Step 6 preferences data saved: %s", tenant['preferences'])'''
+
+# KSI validation endpoints (was add_validation_endpoints.py)
+VALIDATION_FUNCTIONS = '''
+import time
+
+# Table handles are created once per container and reused across warm invocations
+rules_table = dynamodb.Table(VALIDATION_RULES_TABLE)
+executions_table = dynamodb.Table(EXECUTIONS_TABLE)
+
+# Warm containers reuse the rule list for this long before rescanning
+VALIDATION_RULES_CACHE_TTL_SECONDS = 120
+VALIDATION_RULES_CACHE = {'rules': None, 'expires_at': 0.0}
+
+# Attributes the execution/result list views read; everything else stays in DynamoDB
+EXECUTION_HISTORY_FIELDS = ('execution_id', 'tenant_id', 'trigger_source', 'status', 'ksis_validated', 'timestamp')
+VALIDATION_RESULT_FIELDS = (
+    'ksi_id', 'execution_id', 'tenant_id', 'assertion', 'assertion_reason', 'timestamp',
+    'commands_executed', 'successful_commands', 'failed_commands', 'category'
+)
+
+# Constant filter parts, built once and combined per request
+EXECUTION_RECORDS_ONLY = Attr('record_type').not_exists()
+RESULT_RECORDS_ONLY = Attr('record_type').eq('result')
+
+def projection_kwargs(fields):
+    """ProjectionExpression for fields, aliased so reserved words such as status and timestamp are safe"""
+    names = {f'#p{i}': field for i, field in enumerate(fields)}
+    return {'ProjectionExpression': ', '.join(names), 'ExpressionAttributeNames': names}
+
+def get_cached_validation_rules():
+    """All validation rules, rescanned (every page) once the warm-container cache expires"""
+    if VALIDATION_RULES_CACHE['rules'] is None or time.monotonic() >= VALIDATION_RULES_CACHE['expires_at']:
+        scan_kwargs = {}
+        rules = []
+        while True:
+            response = rules_table.scan(**scan_kwargs)
+            rules.extend(response.get('Items', []))
+            if 'LastEvaluatedKey' not in response:
+                break
+            scan_kwargs['ExclusiveStartKey'] = response['LastEvaluatedKey']
+        VALIDATION_RULES_CACHE['rules'] = rules
+        VALIDATION_RULES_CACHE['expires_at'] = time.monotonic() + VALIDATION_RULES_CACHE_TTL_SECONDS
+    return VALIDATION_RULES_CACHE['rules']
+
+# (method, path segment after /api/ksi/) -> handler; one dict lookup per request
+KSI_VALIDATION_ROUTES = {
+    ('POST', 'validate'): lambda event, query_params: trigger_ksi_validation(json.loads(event['body'])),
+    ('GET', 'executions'): lambda event, query_params: get_execution_history(
+        query_params.get('tenant_id'), int(query_params.get('limit', 10))
+    ),
+    ('GET', 'results'): lambda event, query_params: get_validation_results(
+        query_params.get('tenant_id'), query_params.get('execution_id')
+    ),
+}
+
+def handle_ksi_validation_routes(event, context):
+    """Handle KSI validation execution routes"""
+    path = event.get('path', '')
+    method = event.get('httpMethod', '')
+    
+    logger.info("KSI validation route: %s %s", method, path)
+    
+    path_parts = path.split('/')
+    route = KSI_VALIDATION_ROUTES.get((method, path_parts[3] if len(path_parts) > 3 else ''))
+    if route:
+        return route(event, event.get('queryStringParameters') or {})
+    
+    return cors_response(404, {'error': 'KSI validation route not found'})
+
+def trigger_ksi_validation(validation_request):
+    """Trigger KSI validation for a tenant"""
+    logger.info("Triggering KSI validation: %s", validation_request)
+    
+    tenant_id = validation_request.get('tenant_id')
+    trigger_source = validation_request.get('trigger_source', 'api')
+    ksi_filter = validation_request.get('ksi_filter', [])
+    validate_all = validation_request.get('validate_all', False)
+    
+    if not tenant_id:
+        return cors_response(400, {'error': 'tenant_id is required'})
+    
+    started_at = datetime.now(timezone.utc)
+    execution_id = f"exec-{int(started_at.timestamp())}-{uuid.uuid4().hex[:8]}"
+    
+    try:
+        # Get KSIs to validate
+        available_ksis = get_cached_validation_rules()
+        
+        # Filter KSIs if specified
+        if ksi_filter and not validate_all:
+            requested_ids = frozenset(ksi_filter)
+            available_ksis = [ksi for ksi in available_ksis if ksi.get('ksi_id') in requested_ids or ksi.get('rule_id') in requested_ids]
+        
+        # Execution record and results go out as BatchWriteItem calls of up to 25 items
+        execution_record = {
+            'execution_id': execution_id,
+            'tenant_id': tenant_id,
+            'trigger_source': trigger_source,
+            'status': 'completed',
+            'ksis_validated': len(available_ksis),
+            'timestamp': started_at.isoformat()
+        }
+        
+        # Generate simulated results
+        validation_results = []
+        with executions_table.batch_writer(overwrite_by_pkeys=['execution_id', 'timestamp']) as writer:
+            writer.put_item(Item=execution_record)
+            
+            for ksi in available_ksis:
+                ksi_id = ksi.get('ksi_id') or ksi.get('rule_id')
+                # Each result keeps its own timestamp: it is the sort key under the shared execution_id
+                result = {
+                    'ksi_id': ksi_id,
+                    'execution_id': execution_id,
+                    'tenant_id': tenant_id,
+                    'assertion': True,
+                    'assertion_reason': f"✅ {ksi.get('title', 'KSI')} validation passed",
+                    'timestamp': datetime.now(timezone.utc).isoformat(),
+                    'commands_executed': ksi.get('command_count', 0),
+                    'successful_commands': ksi.get('command_count', 0),
+                    'failed_commands': 0,
+                    'category': ksi.get('category', 'Unknown'),
+                    'record_type': 'result'
+                }
+                writer.put_item(Item=result)
+                validation_results.append(result)
+        
+        return cors_response(200, {
+            'status': 'success',
+            'execution_id': execution_id,
+            'ksis_validated': len(validation_results),
+            'message': f'Validation completed for {len(validation_results)} KSIs'
+        })
+        
+    except Exception as e:
+        logger.error("Validation failed: %s", e)
+        return cors_response(500, {'error': str(e)})
+
+def get_execution_history(tenant_id, limit=10):
+    """Get execution history for a tenant"""
+    if not tenant_id:
+        return cors_response(400, {'error': 'tenant_id is required'})
+    
+    try:
+        # Newest-first from the tenant index; Limit applies before the filter, so keep paging
+        query_kwargs = {
+            'IndexName': 'tenant-timestamp-index',
+            'KeyConditionExpression': Key('tenant_id').eq(tenant_id),
+            'FilterExpression': EXECUTION_RECORDS_ONLY,
+            'ScanIndexForward': False,
+            'Limit': limit,
+            **projection_kwargs(EXECUTION_HISTORY_FIELDS)
+        }
+        executions = []
+        while len(executions) < limit:
+            response = executions_table.query(**query_kwargs)
+            executions.extend(response.get('Items', []))
+            if 'LastEvaluatedKey' not in response:
+                break
+            query_kwargs['ExclusiveStartKey'] = response['LastEvaluatedKey']
+        
+        return cors_response(200, {
+            'executions': executions[:limit]
+        })
+    except Exception as e:
+        return cors_response(500, {'error': str(e)})
+
+def get_validation_results(tenant_id, execution_id=None):
+    """Get validation results for a tenant"""
+    if not tenant_id:
+        return cors_response(400, {'error': 'tenant_id is required'})
+    
+    try:
+        if execution_id:
+            # execution_id is the table's partition key, so one execution is a single-partition query
+            query_kwargs = {
+                'KeyConditionExpression': Key('execution_id').eq(execution_id),
+                'FilterExpression': Attr('tenant_id').eq(tenant_id) & RESULT_RECORDS_ONLY,
+                **projection_kwargs(VALIDATION_RESULT_FIELDS)
+            }
+        else:
+            query_kwargs = {
+                'IndexName': 'tenant-timestamp-index',
+                'KeyConditionExpression': Key('tenant_id').eq(tenant_id),
+                'FilterExpression': RESULT_RECORDS_ONLY,
+                'ScanIndexForward': False,
+                **projection_kwargs(VALIDATION_RESULT_FIELDS)
+            }
+        
+        results = []
+        while True:
+            response = executions_table.query(**query_kwargs)
+            results.extend(response.get('Items', []))
+            if 'LastEvaluatedKey' not in response:
+                break
+            query_kwargs['ExclusiveStartKey'] = response['LastEvaluatedKey']
+        
+        # Get latest results per KSI if no execution_id specified; items arrive newest-first
+        if not execution_id and results:
+            latest_results = {}
+            for result in results:
+                latest_results.setdefault(result.get('ksi_id'), result)
+            results = list(latest_results.values())
+        
+        results.sort(key=lambda x: x.get('ksi_id', ''))
+        
+        return cors_response(200, {
+            'results': results
+        })
+    except Exception as e:
+        return cors_response(500, {'error': str(e)})
+
+'''
+
+# Replaces the admin/tenant if/elif chain at the top of lambda_handler's try block
+LAMBDA_HANDLER_DISPATCH = '''        # KSI Validation Routes (NEW!)
+        if path.startswith('/api/ksi/'):
+            return handle_ksi_validation_routes(event, context)
+        
+        # Admin Routes (existing)
+        elif path.startswith('/api/admin'):
+            return handle_admin_request(event, context)
+        
+        # Tenant Routes (existing)  
+        elif path.startswith('/api/tenant'):
+            return handle_tenant_request(event, context)
+        
+        else:
+            return cors_response(404, {'error': 'Route not found'})'''
+
+DYNAMODB_RESOURCE = (
+    "from botocore.config import Config\n"
+    "dynamodb = boto3.resource('dynamodb', config=Config(tcp_keepalive=True, max_pool_connections=10, retries={'mode': 'standard'}))"
+)
+
+def is_step_test(node, step_number):
+    """True for the `step_number == N` test of an onboarding step branch"""
+    return (isinstance(node, ast.Compare) and isinstance(node.left, ast.Name) and node.left.id == 'step_number'
+            and isinstance(node.ops[0], ast.Eq) and isinstance(node.comparators[0], ast.Constant)
+            and node.comparators[0].value == step_number)
+
+def step_section(tree, step_number):
+    """(start, end, indent) of an elif step branch, up to the next branch of the chain"""
+    for node in ast.walk(tree):
+        if isinstance(node, ast.If) and is_step_test(node.test, step_number):
+            if node.orelse and isinstance(node.orelse[0], ast.If):
+                end = node.orelse[0].lineno - 1
+            else:
+                end = node.body[-1].end_lineno
+            return node.lineno - 1, end, node.col_offset
+    return None
+
+def step_handler_start(tree):
+    """Top of the module-level function holding the onboarding step chain"""
+    for node in tree.body:
+        if isinstance(node, ast.FunctionDef) and step_section(node, 4):
+            first = node.decorator_list[0] if node.decorator_list else node
+            return first.lineno - 1, first.lineno - 1, 0
+    return None
+
+def lambda_handler_start(tree):
+    for node in tree.body:
+        if isinstance(node, ast.FunctionDef) and node.name == 'lambda_handler':
+            first = node.decorator_list[0] if node.decorator_list else node
+            return first.lineno - 1, first.lineno - 1, 0
+    return None
+
+def lambda_handler_dispatch(tree):
+    """The route if/elif chain opening lambda_handler's try block"""
+    for node in tree.body:
+        if isinstance(node, ast.FunctionDef) and node.name == 'lambda_handler':
+            for stmt in ast.walk(node):
+                if isinstance(stmt, ast.Try) and isinstance(stmt.body[0], ast.If):
+                    route = stmt.body[0]
+                    if "'/api/admin'" in ast.unparse(route.test):
+                        return route.lineno - 1, route.end_lineno, 0
+    return None
+
+def dynamodb_resource(tree):
+    """Top-level `dynamodb = boto3.resource('dynamodb')` without a client config"""
+    for node in tree.body:
+        if (isinstance(node, ast.Assign) and len(node.targets) == 1 and isinstance(node.targets[0], ast.Name)
+                and node.targets[0].id == 'dynamodb' and isinstance(node.value, ast.Call)
+                and ast.unparse(node.value) == "boto3.resource('dynamodb')"):
+            return node.lineno - 1, node.end_lineno, 0
+    return None
+
+# (description, locator, replacement); locators return (start line, end line, indent) or None
+PATCHES = [
+    ('step field map', step_handler_start, STEP_FIELD_MAP_CODE),
+    ('Step 4 field mapping', lambda tree: step_section(tree, 4), STEP4_CODE),
+    ('Step 5 field mapping', lambda tree: step_section(tree, 5), STEP5_CODE),
+    ('Step 6 field mapping', lambda tree: step_section(tree, 6), STEP6_CODE),
+    ('validation endpoints', lambda_handler_start, VALIDATION_FUNCTIONS),
+    ('KSI route dispatch', lambda_handler_dispatch, LAMBDA_HANDLER_DISPATCH),
+    ('DynamoDB keep-alive', dynamodb_resource, DYNAMODB_RESOURCE),
+]
+
+# Read the current handler.py
+with open('handler.py', 'r') as f:
+    content = f.read()
+
+# Every anchor is located against the one parse before any line moves
+tree = ast.parse(content)
+splices = []
+for description, locate, replacement in PATCHES:
+    span = locate(tree)
+    if span:
+        start, end, indent = span
+        splices.append((start, end, ' ' * indent + replacement + '\n'))
+        print(f"✅ Applied {description}")
+    else:
+        print(f"❌ Could not find the {description} section in handler.py")
+
+# Splice bottom-up so earlier line numbers stay valid
+lines = content.splitlines(keepends=True)
+for start, end, text in sorted(splices, reverse=True):
+    lines[start:end] = [text]
+
+# Write the updated content
+with open('handler.py', 'w') as f:
+    f.write(''.join(lines))
+
+print("✅ Successfully patched handler.py")
@@ -1,13 +1,28 @@
 import json
 import boto3
+from botocore.config import Config
+from botocore.exceptions import ClientError
 import uuid
 from datetime import datetime, timezone, timedelta
 from typing import Dict, List, Any, Optional
 import os
+import time
+import heapq
 import logging
+import random
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from operator import itemgetter
 from boto3.dynamodb.conditions import Key, Attr
+from boto3.dynamodb.types import TypeDeserializer
 from decimal import Decimal
 
+try:
+    import orjson  # Provided by the dependencies Lambda layer
+except ImportError:
+    orjson = None
+
 # Setup logging
 logger = logging.getLogger()
 logger.setLevel(logging.INFO)
@@ -18,35 +33,268 @@ EXECUTIONS_TABLE = os.environ.get('EXECUTIONS_TABLE', 'ksi-mvp-executions-dev')
 VALIDATION_RULES_TABLE = os.environ.get('VALIDATION_RULES_TABLE', 'ksi-mvp-validation-rules-dev')
 TENANT_OVERRIDES_TABLE = os.environ.get('TENANT_OVERRIDES_TABLE', 'ksi-mvp-tenant-rule-overrides-dev')
 
-dynamodb = boto3.resource('dynamodb')
+# Number of executions returned by /api/ksi/executions
+EXECUTION_HISTORY_LIMIT = 10
+
+# Rule attributes read by /api/admin/ksi-defaults
+KSI_DEFAULT_FIELDS = ('ksi_id', 'rule_id', 'title', 'category', 'automation_type', 'description', 'compliance_framework')
+
+# Step counters stored on each rule at write time so validation_steps need not be read
+STEP_SUMMARY_FIELDS = ('validation_steps_count', 'has_cli_steps')
+
+# Segments for the remaining full scan of the executions table, which grows with every run
+EXECUTIONS_SCAN_SEGMENTS = 4
+
+# Execution attributes read by /api/ksi/executions
+EXECUTION_SUMMARY_FIELDS = ('execution_id', 'tenant_id', 'timestamp', 'ksis_validated', 'status', 'trigger_source', 'record_type')
+
+# Matches execution summaries, including legacy ones written before record_type existed
+EXECUTION_SUMMARY_FILTER = 'attribute_not_exists(record_type) OR record_type = :record_type'
+
+# Result attributes consumed by the dashboards from /api/ksi/results
+VALIDATION_RESULT_FIELDS = (
+    'ksi_id', 'execution_id', 'tenant_id', 'assertion', 'assertion_reason', 'timestamp',
+    'commands_executed', 'successful_commands', 'failed_commands', 'cli_command_details',
+    'category', 'status', 'error', 'record_type'
+)
+
+# Tenant attributes read by /api/admin/tenants; enabled_ksis_count is kept beside enabled_ksis on every write
+TENANT_LIST_FIELDS = ('tenant_id', 'organization.name', 'status', 'onboarding_step', 'enabled_ksis_count', 'created_date')
+
+# Tenant attributes read by the IAM instruction and connection test steps
+TENANT_ACCOUNT_FIELDS = ('tenant_id', 'aws_accounts')
+
+# Rule attributes read by trigger_ksi_validation
+VALIDATION_RULE_FIELDS = ('ksi_id', 'rule_id', 'title', 'category', 'validation_steps_count')
+
+# Filters up to this many IDs read their rules directly instead of scanning the table;
+# each ID costs an index query, so larger filters are cheaper as one cached full load
+TARGETED_RULE_LOOKUP_MAX_IDS = 8
+
+# Concurrent per-KSI validations within one execution
+VALIDATION_MAX_WORKERS = 16
+
+# Simulated validation outcomes (MVP)
+SIMULATED_PASS_RATE = 0.75
+_RNG = random.Random()
+
+# Response headers and bodies that never change are built once at import
+CORS_HEADERS = {
+    'Access-Control-Allow-Origin': '*',
+    'Access-Control-Allow-Methods': 'GET, POST, PUT, DELETE, OPTIONS',
+    'Access-Control-Allow-Headers': 'Content-Type, Authorization, X-Requested-With',
+    'Content-Type': 'application/json'
+}
+
+CORS_PREFLIGHT_RESPONSE = {
+    'statusCode': 200,
+    'headers': {
+        'Access-Control-Allow-Origin': '*',
+        'Access-Control-Allow-Methods': 'GET, POST, PUT, DELETE, OPTIONS',
+        'Access-Control-Allow-Headers': 'Content-Type, Authorization, X-Requested-With',
+        'Access-Control-Max-Age': '86400'
+    },
+    'body': json.dumps({'message': 'CORS preflight successful'})
+}
+
+TENANT_NOT_FOUND_BODY = json.dumps({'error': 'Tenant not found'})
+
+# Warm containers reuse the ksi-defaults response for this long before rescanning rules
+KSI_DEFAULTS_CACHE_TTL_SECONDS = 60
+KSI_DEFAULTS_CACHE = {'payload': None, 'response': None, 'expires_at': 0.0}
+
+# Validation rules read by trigger_ksi_validation, cached the same way
+VALIDATION_RULES_CACHE_TTL_SECONDS = 60
+VALIDATION_RULES_CACHE = {'rules': None, 'expires_at': 0.0}
+
+# Targeted rule lookups, read-aside per requested rule_id/ksi_id: id -> (expires_at, rules)
+RULES_BY_ID_CACHE = {}
+RULES_BY_ID_CACHE_MAX_ENTRIES = 256
+
+# Keep-alive connections survive between warm invocations; the pool covers the validation workers
+AWS_CLIENT_CONFIG = Config(
+    tcp_keepalive=True,
+    max_pool_connections=50,
+    retries={'mode': 'standard'}
+)
+
+dynamodb = boto3.resource('dynamodb', config=AWS_CLIENT_CONFIG)
+
+# Low-level client for read-heavy paths that work on raw attribute values
+dynamodb_client = boto3.client('dynamodb', config=AWS_CLIENT_CONFIG)
+
+sts_client = boto3.client('sts', config=AWS_CLIENT_CONFIG)
 
-def clean_dynamodb_item(item):
-    """Convert DynamoDB item to JSON serializable format"""
-    if isinstance(item, list):
-        return [clean_dynamodb_item(i) for i in item]
-    elif isinstance(item, dict):
-        return {k: clean_dynamodb_item(v) for k, v in item.items()}
-    elif isinstance(item, Decimal):
-        return int(item) if item % 1 == 0 else float(item)
-    return item
+# Table handles are created once per container and reused across warm invocations
+tenants_table = dynamodb.Table(TENANTS_TABLE)
+executions_table = dynamodb.Table(EXECUTIONS_TABLE)
+rules_table = dynamodb.Table(VALIDATION_RULES_TABLE)
+overrides_table = dynamodb.Table(TENANT_OVERRIDES_TABLE)
 
-def cors_response(status_code: int, body: dict):
-    """Return CORS-enabled response"""
+def warm_dynamodb_connections():
+    """Open both DynamoDB connection pools during Lambda INIT so the first request skips DNS/TLS setup"""
+    for client in (dynamodb.meta.client, dynamodb_client):
+        try:
+            client.describe_table(TableName=TENANTS_TABLE)
+        except Exception as e:
+            logger.warning("DynamoDB connection warm-up failed: %s", e)
+
+# Only inside Lambda; local imports of the handler stay offline
+if os.environ.get('AWS_LAMBDA_FUNCTION_NAME'):
+    warm_dynamodb_connections()
+
+def json_default(value):
+    """Encode values json/orjson cannot handle natively, mainly DynamoDB Decimals"""
+    if isinstance(value, Decimal):
+        return int(value) if value % 1 == 0 else float(value)
+    return str(value)
+
+def encode_json(body) -> str:
+    """Serialize a response body, with orjson when the dependencies layer is present"""
+    if orjson is not None:
+        return orjson.dumps(body, default=json_default, option=orjson.OPT_NON_STR_KEYS).decode()
+    return json.dumps(body, default=json_default)
+
+def from_attribute_value(value: dict):
+    """Convert a raw DynamoDB attribute value straight to a JSON serializable value"""
+    (type_code, raw), = value.items()
+    if type_code == 'S' or type_code == 'BOOL':
+        return raw
+    elif type_code == 'N':
+        # Integral counters dominate (steps, commands); only fractional values need Decimal
+        try:
+            return int(raw)
+        except ValueError:
+            number = Decimal(raw)
+            return int(number) if number % 1 == 0 else float(number)
+    elif type_code == 'M':
+        return {k: from_attribute_value(v) for k, v in raw.items()}
+    elif type_code == 'L':
+        return [from_attribute_value(v) for v in raw]
+    elif type_code == 'NULL':
+        return None
+    elif type_code == 'NS':
+        return [from_attribute_value({'N': n}) for n in raw]
+    elif type_code == 'SS':
+        return list(raw)
+    return TypeDeserializer().deserialize(value)
+
+def plain_item(raw_item: dict, fields=None) -> dict:
+    """Convert a raw DynamoDB item, optionally keeping only the given fields"""
+    if fields is None:
+        return {k: from_attribute_value(v) for k, v in raw_item.items()}
+    return {k: from_attribute_value(raw_item[k]) for k in fields if k in raw_item}
+
+def scan_table_items(table_name: str, raw: bool = False, **scan_kwargs):
+    """Yield every item in a table, following LastEvaluatedKey across scan pages
+
+    With raw=True items come from the low-level client as attribute-value dicts.
+    """
+    client = dynamodb_client if raw else dynamodb.meta.client
+    paginator = client.get_paginator('scan')
+    pages = paginator.paginate(
+        TableName=table_name,
+        PaginationConfig={'PageSize': 500},
+        **scan_kwargs
+    )
+    for page in pages:
+        yield from page.get('Items', [])
+
+def parallel_scan_items(table_name: str, total_segments: int, raw: bool = False, **scan_kwargs) -> list:
+    """Scan a table as total_segments concurrent segments and return all items
+
+    Item order across segments is arbitrary; callers sort what they need.
+    """
+    def scan_segment(segment):
+        return list(scan_table_items(table_name, raw=raw, Segment=segment, TotalSegments=total_segments, **scan_kwargs))
+    
+    with ThreadPoolExecutor(max_workers=total_segments) as executor:
+        return [item for segment_items in executor.map(scan_segment, range(total_segments)) for item in segment_items]
+
+def query_table_items(table_name: str, raw: bool = False, **query_kwargs):
+    """Yield every item matched by a query, following LastEvaluatedKey across pages
+
+    With raw=True items come from the low-level client as attribute-value dicts.
+    """
+    client = dynamodb_client if raw else dynamodb.meta.client
+    paginator = client.get_paginator('query')
+    pages = paginator.paginate(TableName=table_name, **query_kwargs)
+    for page in pages:
+        yield from page.get('Items', [])
+
+def batch_get_raw_items(table_name: str, keys: list, **request_params):
+    """Yield raw items for the given raw keys, 100 keys per BatchGetItem call"""
+    for start in range(0, len(keys), 100):
+        request_items = {table_name: {'Keys': keys[start:start + 100], **request_params}}
+        while request_items:
+            response = dynamodb_client.batch_get_item(RequestItems=request_items)
+            yield from response.get('Responses', {}).get(table_name, [])
+            request_items = response.get('UnprocessedKeys')
+
+_CLI_STEP_KEYS = frozenset(('service', 'action'))
+
+def has_cli_steps(raw_steps: list) -> bool:
+    """True if any raw validation step (an {'M': ...} value) names an AWS CLI service and action"""
+    for step in raw_steps:
+        if _CLI_STEP_KEYS <= step.get('M', {}).keys():
+            return True
+    return False
+
+def projection_params(fields) -> dict:
+    """Build ProjectionExpression kwargs with every attribute name aliased
+
+    Dotted fields such as 'organization.name' project a nested map attribute.
+    """
+    aliases = {}
+    paths = []
+    for field in fields:
+        paths.append('.'.join(aliases.setdefault(part, f'#p{len(aliases)}') for part in field.split('.')))
+    return {
+        'ProjectionExpression': ', '.join(paths),
+        'ExpressionAttributeNames': {alias: part for part, alias in aliases.items()}
+    }
+
+def update_params(updates: dict) -> dict:
+    """Build a SET UpdateExpression with every attribute name and value aliased
+
+    Keys are attribute paths, either dotted strings such as 'aws_accounts.role_status'
+    or tuples of path parts when a part may itself contain a dot.
+    """
+    aliases = {}
+    values = {}
+    assignments = []
+    for field, value in updates.items():
+        parts = field.split('.') if isinstance(field, str) else field
+        path = '.'.join(aliases.setdefault(part, f'#u{len(aliases)}') for part in parts)
+        placeholder = f':u{len(values)}'
+        values[placeholder] = value
+        assignments.append(f'{path} = {placeholder}')
+    return {
+        'UpdateExpression': 'SET ' + ', '.join(assignments),
+        'ExpressionAttributeNames': {alias: part for part, alias in aliases.items()},
+        'ExpressionAttributeValues': values
+    }
+
+def cors_response(status_code: int, body):
+    """Return CORS-enabled response
+
+    body may be a dict or an already JSON-encoded string such as TENANT_NOT_FOUND_BODY.
+    Decimals from DynamoDB are converted during encoding rather than in a separate pass.
+    """
+    if not isinstance(body, str):
+        body = encode_json(body)
     return {
         'statusCode': status_code,
-        'headers': {
-            'Access-Control-Allow-Origin': '*',
-            'Access-Control-Allow-Methods': 'GET, POST, PUT, DELETE, OPTIONS',
-            'Access-Control-Allow-Headers': 'Content-Type, Authorization, X-Requested-With',
-            'Content-Type': 'application/json'
-        },
-        'body': json.dumps(clean_dynamodb_item(body), default=str)
+        'headers': CORS_HEADERS,
+        'body': body
     }
 
 def lambda_handler(event, context):
     """Main Lambda handler - supports individual tenant EventBridge scheduling"""
     
-    logger.info(f"Received event: {json.dumps(event)}")
+    # Full event dumps are DEBUG-only; at INFO the dump is never built
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Received event: %s", json.dumps(event, default=str))
     
     # 🕐 Handle EventBridge scheduled events (individual tenant)
     if event.get('source') == 'eventbridge-scheduler':
@@ -60,16 +308,7 @@ def lambda_handler(event, context):
     
     # Handle CORS preflight requests
     if event.get('httpMethod') == 'OPTIONS':
-        return {
-            'statusCode': 200,
-            'headers': {
-                'Access-Control-Allow-Origin': '*',
-                'Access-Control-Allow-Methods': 'GET, POST, PUT, DELETE, OPTIONS',
-                'Access-Control-Allow-Headers': 'Content-Type, Authorization, X-Requested-With',
-                'Access-Control-Max-Age': '86400'
-            },
-            'body': json.dumps({'message': 'CORS preflight successful'})
-        }
+        return CORS_PREFLIGHT_RESPONSE
     
     # Handle API Gateway requests (existing functionality)
     if 'httpMethod' in event:
@@ -88,8 +327,8 @@ def handle_individual_tenant_scheduled_event(event, context):
         trigger_source = event.get('trigger_source', 'scheduled_daily_individual')
         offset_minutes = event.get('offset_minutes', 0)
         
-        logger.info(f"🕐 Starting scheduled validation for individual tenant: {tenant_id} ({tenant_name})")
-        logger.info(f"🕐 Trigger source: {trigger_source}, Offset: {offset_minutes} minutes")
+        logger.info("🕐 Starting scheduled validation for individual tenant: %s (%s)", tenant_id, tenant_name)
+        logger.info("🕐 Trigger source: %s, Offset: %s minutes", trigger_source, offset_minutes)
         
         if not tenant_id:
             raise ValueError("tenant_id is required for individual tenant scheduling")
@@ -104,15 +343,15 @@ def handle_individual_tenant_scheduled_event(event, context):
             'schedule_frequency': event.get('schedule_frequency', 'daily')
         }
         
-        logger.info(f"🕐 Validation request: {validation_request}")
+        logger.info("🕐 Validation request: %s", validation_request)
         
         # Execute validation using existing trigger_ksi_validation function
         result = trigger_ksi_validation(validation_request)
         result_data = json.loads(result['body'])
         
         if result['statusCode'] == 200:
-            logger.info(f"✅ Scheduled validation completed successfully for {tenant_id}")
-            logger.info(f"📊 Results: {result_data.get('ksis_validated', 0)} KSIs validated")
+            logger.info("✅ Scheduled validation completed successfully for %s", tenant_id)
+            logger.info("📊 Results: %s KSIs validated", result_data.get('ksis_validated', 0))
             
             # Return success response for EventBridge
             return {
@@ -129,11 +368,11 @@ def handle_individual_tenant_scheduled_event(event, context):
                 })
             }
         else:
-            logger.error(f"❌ Scheduled validation failed for {tenant_id}: {result_data.get('error')}")
+            logger.error("❌ Scheduled validation failed for %s: %s", tenant_id, result_data.get('error'))
             raise Exception(f"Validation failed: {result_data.get('error')}")
             
     except Exception as e:
-        logger.error(f"❌ Error in scheduled validation: {str(e)}")
+        logger.error("❌ Error in scheduled validation: %s", e)
         return {
             'statusCode': 500,
             'body': json.dumps({
@@ -144,158 +383,188 @@ def handle_individual_tenant_scheduled_event(event, context):
             })
         }
 
+def health_check():
+    """Report service health and enabled features"""
+    return cors_response(200, {
+        'status': 'healthy', 
+        'timestamp': datetime.now(timezone.utc).isoformat(),
+        'version': '2.0',
+        'features': ['api_gateway', 'individual_tenant_scheduling', 'ksi_validation', 'onboarding']
+    })
+
+# ============================================================================
+# ROUTE TABLES - looked up once per request instead of walking if/elif chains
+# ============================================================================
+
+# Exact API paths (any method)
+API_ROUTES = {
+    '/api/health': lambda event, context, path_parts: health_check(),
+}
+
+# /api/{area}/... dispatch, keyed by the path segment after /api/
+API_AREA_ROUTES = {
+    'ksi': lambda event, context, path_parts: handle_ksi_validation_routes(event, context, path_parts),
+    'admin': lambda event, context, path_parts: handle_admin_routes(event, context, path_parts),
+    'tenant': lambda event, context, path_parts: handle_tenant_routes(event, context),
+}
+
+# Exact admin routes, keyed by (method, path)
+ADMIN_ROUTES = {
+    ('POST', '/api/admin/onboarding/start'): lambda event: start_tenant_onboarding(json.loads(event['body'])),
+    ('GET', '/api/admin/ksi-defaults'): lambda event: get_ksi_defaults(),
+    ('GET', '/api/admin/tenants'): lambda event: get_all_tenants(),
+    ('POST', '/api/admin/tenants'): lambda event: create_tenant(json.loads(event['body'])),
+    ('GET', '/api/admin/system/status'): lambda event: get_system_status(),
+}
+
+# Tenant map attribute each onboarding step (1-6) merges its submitted fields into;
+# the same paths address the fields in UpdateItem expressions
+ONBOARDING_STEP_SECTIONS = {
+    1: 'organization',
+    2: 'contacts',
+    3: 'aws_accounts',
+    4: 'iam_role_config',
+    5: 'compliance',
+    6: 'preferences'
+}
+
+# Tenant fields echoed back by the onboarding endpoints
+ONBOARDING_SUMMARY_FIELDS = ('tenant_id', 'status', 'onboarding_step', 'last_updated')
+
+# What each onboarding step needs, shown as the next step's requirements
+ONBOARDING_STEP_REQUIREMENTS = {
+    1: "Organization name and type are required",
+    2: "Primary contact information is required",
+    3: "AWS account ID and primary region are required",
+    4: "Cross-account IAM role must be created and verified",
+    5: "FedRAMP compliance level and status are required",
+    6: "Notification preferences must be configured",
+    7: "Review all information and select KSIs to enable"
+}
+
+# /api/admin/onboarding/{tenant_id}/{endpoint}, keyed by (method, endpoint)
+ONBOARDING_ROUTES = {
+    ('PUT', 'step'): lambda tenant_id, event: update_onboarding_step(tenant_id, json.loads(event['body'])),
+    ('GET', 'step'): lambda tenant_id, event: get_onboarding_status(tenant_id),
+    ('GET', 'iam-instructions'): lambda tenant_id, event: generate_iam_role_instructions(tenant_id),
+    ('POST', 'test-connection'): lambda tenant_id, event: test_cross_account_connection(tenant_id),
+    ('POST', 'complete'): lambda tenant_id, event: complete_tenant_onboarding(tenant_id),
+}
+
+# /api/admin/tenants/{tenant_id}[/...], keyed by (method, endpoint); '' matches any suffix
+TENANT_ADMIN_ROUTES = {
+    ('PUT', 'ksi-config'): lambda tenant_id, event: update_tenant_ksi_config(tenant_id, json.loads(event['body'])),
+    ('PUT', ''): lambda tenant_id, event: update_tenant(tenant_id, json.loads(event['body'])),
+    ('GET', ''): lambda tenant_id, event: get_tenant_details(tenant_id),
+    ('DELETE', ''): lambda tenant_id, event: delete_tenant(tenant_id),
+}
+
+# /api/ksi/{section}[/...], keyed by (method, section)
+KSI_ROUTES = {
+    ('GET', 'results'): lambda event: get_validation_results((event.get('queryStringParameters') or {}).get('tenant_id')),
+    ('GET', 'executions'): lambda event: get_execution_history((event.get('queryStringParameters') or {}).get('tenant_id')),
+}
+
 def handle_api_gateway_request(event, context):
     """Handle API Gateway requests (existing functionality)"""
     path = event.get('path', '')
     method = event.get('httpMethod', '')
     
-    logger.info(f"Processing API request: {method} {path}")
+    # Bounded per-request summary at INFO; the full event is only dumped at DEBUG
+    logger.info("Processing API request: %s %s rid=%s", method, path, (event.get('requestContext') or {}).get('requestId'))
     
     try:
-        # Health check
-        if path == '/api/health':
-            return cors_response(200, {
-                'status': 'healthy', 
-                'timestamp': datetime.now(timezone.utc).isoformat(),
-                'version': '2.0',
-                'features': ['api_gateway', 'individual_tenant_scheduling', 'ksi_validation', 'onboarding']
-            })
-        
-        # KSI validation routes
-        elif path.startswith('/api/ksi/'):
-            return handle_ksi_validation_routes(event, context)
-        
-        # Admin routes
-        elif path.startswith('/api/admin/'):
-            return handle_admin_routes(event, context)
-        
-        # Tenant routes  
-        elif path.startswith('/api/tenant/'):
-            return handle_tenant_routes(event, context)
-        
-        else:
-            return cors_response(404, {'error': f'Route not found: {path}'})
+        route = API_ROUTES.get(path)
+        if route:
+            return route(event, context, None)
+        
+        # Split once; area handlers reuse the parts
+        path_parts = path.split('/')
+        if len(path_parts) > 3 and path_parts[0] == '' and path_parts[1] == 'api':
+            route = API_AREA_ROUTES.get(path_parts[2])
+            if route:
+                return route(event, context, path_parts)
+        
+        return cors_response(404, {'error': f'Route not found: {path}'})
             
     except Exception as e:
-        logger.error(f"Error processing API request: {str(e)}")
+        logger.error("Error processing API request: %s", e)
         return cors_response(500, {'error': str(e)})
 
-def handle_admin_routes(event, context):
+def handle_admin_routes(event, context, path_parts=None):
     """Handle admin API requests with ALL onboarding endpoints"""
     path = event.get('path', '')
     method = event.get('httpMethod', '')
     
-    logger.info(f"🔍 Admin route: {method} {path}")
+    logger.info("🔍 Admin route: %s %s", method, path)
     
     try:
-        # 🚀 ONBOARDING WORKFLOW ENDPOINTS
-        if path == '/api/admin/onboarding/start':
-            if method == 'POST':
-                logger.info("🔍 Matched onboarding start route")
-                return start_tenant_onboarding(json.loads(event['body']))
-        
-        elif '/api/admin/onboarding/' in path:
-            logger.info("🔍 Matched onboarding sub-route")
-            # Extract tenant_id from path like /api/admin/onboarding/{tenant-id}/step
+        route = ADMIN_ROUTES.get((method, path))
+        if route:
+            return route(event)
+        
+        if path_parts is None:
             path_parts = path.split('/')
-            if len(path_parts) >= 5:
-                tenant_id = path_parts[4]
+        
+        # Templated routes: /api/admin/{section}/{tenant_id}/...
+        if len(path_parts) >= 5:
+            section = path_parts[3]
+            tenant_id = path_parts[4]
+            
+            if section == 'onboarding':
                 endpoint = path_parts[5] if len(path_parts) > 5 else ''
-                
-                if endpoint == 'step':
-                    if method == 'PUT':
-                        return update_onboarding_step(tenant_id, json.loads(event['body']))
-                    elif method == 'GET':
-                        return get_onboarding_status(tenant_id)
-                
-                elif endpoint == 'iam-instructions':
-                    if method == 'GET':
-                        return generate_iam_role_instructions(tenant_id)
-                
-                elif endpoint == 'test-connection':
-                    if method == 'POST':
-                        return test_cross_account_connection(tenant_id)
-                
-                elif endpoint == 'complete':
-                    if method == 'POST':
-                        return complete_tenant_onboarding(tenant_id)
-        
-        # KSI Defaults endpoint
-        elif path == '/api/admin/ksi-defaults':
-            if method == 'GET':
-                logger.info("🔍 Matched KSI defaults route")
-                return get_ksi_defaults()
-        
-        # Tenants management (plural - list all)
-        elif path == '/api/admin/tenants':
-            logger.info("🔍 Matched tenants plural route")
-            if method == 'GET':
-                return get_all_tenants()
-            elif method == 'POST':
-                return create_tenant(json.loads(event['body']))
-        
-        # Individual tenant routes (singular)
-        elif '/api/admin/tenants/' in path:
-            logger.info(f"🔍 Matched individual tenant route: {path}")
-            path_parts = path.split('/')
-            logger.info(f"🔍 Path parts: {path_parts}, Length: {len(path_parts)}")
+                route = ONBOARDING_ROUTES.get((method, endpoint))
+            elif section == 'tenants':
+                endpoint = 'ksi-config' if path_parts[-1] == 'ksi-config' else ''
+                route = TENANT_ADMIN_ROUTES.get((method, endpoint)) or TENANT_ADMIN_ROUTES.get((method, ''))
             
-            if len(path_parts) >= 5:
-                tenant_id = path_parts[4]
-                logger.info(f"🔍 Extracted tenant_id: {tenant_id}")
-                
-                # Individual tenant KSI config update
-                if path.endswith('/ksi-config') and method == 'PUT':
-                    logger.info(f"🔍 Matched KSI config route for tenant {tenant_id}")
-                    body_data = json.loads(event['body'])
-                    return update_tenant_ksi_config(tenant_id, body_data)
-                
-                # Other tenant routes
-                elif method == 'PUT':
-                    logger.info(f"🔍 Matched PUT tenant route for {tenant_id}")
-                    return update_tenant(tenant_id, json.loads(event['body']))
-                elif method == 'GET':
-                    logger.info(f"🔍 Matched GET tenant route for {tenant_id} - calling get_tenant_details")
-                    return get_tenant_details(tenant_id)
-                elif method == 'DELETE':
-                    logger.info(f"🔍 Matched DELETE tenant route for {tenant_id}")
-                    return delete_tenant(tenant_id)
-                else:
-                    logger.info(f"🔍 No method match for {method} on tenant route")
-            else:
-                logger.info(f"🔍 Path parts too short: {len(path_parts)}, expected >= 5")
-        
-        # System status
-        elif path == '/api/admin/system/status':
-            if method == 'GET':
-                logger.info("🔍 Matched system status route")
-                return get_system_status()
-        
-        logger.info(f"🔍 No route matched for: {method} {path}")
+            if route:
+                return route(tenant_id, event)
+        
+        logger.info("🔍 No route matched for: %s %s", method, path)
         return cors_response(404, {'error': f'Admin route not found: {path}'})
         
     except Exception as e:
-        logger.error(f"❌ Exception in handle_admin_routes: {str(e)}")
-        logger.error(f"❌ Exception type: {type(e)}")
+        logger.error("❌ Exception in handle_admin_routes: %s", e)
+        logger.error("❌ Exception type: %s", type(e))
         import traceback
-        logger.error(f"❌ Full traceback: {traceback.format_exc()}")
+        logger.error("❌ Full traceback: %s", traceback.format_exc())
         return cors_response(500, {'error': f'Admin route error: {str(e)}'})
 
 # ============================================================================
 # 7-STEP ONBOARDING IMPLEMENTATION - RESTORED!
 # ============================================================================
 
+def onboarding_tenant_summary(tenant):
+    """Tenant fields returned by onboarding endpoints; last_updated doubles as a version token
+
+    The full document is served by GET /api/admin/tenants/{tenant_id}.
+    """
+    summary = {field: tenant[field] for field in ONBOARDING_SUMMARY_FIELDS if field in tenant}
+    summary['tenant_version'] = summary.pop('last_updated', None)
+    return summary
+
+def put_new_tenant(tenant):
+    """Create a tenant, drawing a new tenant_id if the generated one is already taken"""
+    while True:
+        try:
+            tenants_table.put_item(Item=tenant, ConditionExpression=Attr('tenant_id').not_exists())
+            return tenant['tenant_id']
+        except tenants_table.meta.client.exceptions.ConditionalCheckFailedException:
+            tenant['tenant_id'] = f"tenant-{uuid.uuid4().hex[:8]}"
+
 def start_tenant_onboarding(onboarding_data):
     """Start the 7-step onboarding process"""
-    logger.info(f"Starting onboarding: {onboarding_data}")
+    logger.info("Starting onboarding: %s", onboarding_data)
     
     tenant_id = f"tenant-{str(uuid.uuid4())[:8]}"
+    now_iso = datetime.now(timezone.utc).isoformat()
     
     tenant = {
         'tenant_id': tenant_id,
         'status': 'onboarding',
         'onboarding_step': 1,
-        'created_date': datetime.now(timezone.utc).isoformat(),
+        'created_date': now_iso,
         
         # Initialize all sections
         'organization': onboarding_data.get('organization', {}),
@@ -334,105 +603,125 @@ def start_tenant_onboarding(onboarding_data):
         
         # KSI configuration (will be set in step 7)
         'enabled_ksis': [],
+        'enabled_ksis_count': 0,
         'ksi_schedule': 'daily',
         
         # System fields
         'onboarded_by': onboarding_data.get('created_by', 'system'),
-        'last_updated': datetime.now(timezone.utc).isoformat()
+        'last_updated': now_iso
     }
     
-    table = dynamodb.Table(TENANTS_TABLE)
-    table.put_item(Item=tenant)
+    tenant_id = put_new_tenant(tenant)
     
-    logger.info(f"Created tenant {tenant_id} for onboarding")
+    logger.info("Created tenant %s for onboarding", tenant_id)
     
     return cors_response(201, {
         'tenant_id': tenant_id,
         'message': 'Onboarding started successfully',
         'current_step': 1,
         'next_step_requirements': get_next_step_requirements(tenant, 1),
-        'tenant': tenant
+        'tenant': onboarding_tenant_summary(tenant)
     })
 
+def write_onboarding_updates(tenant_id, updates, step):
+    """Apply onboarding field updates, moving onboarding_step forward only
+
+    Returns the updated tenant, or None if the tenant does not exist.
+    """
+    try:
+        response = tenants_table.update_item(
+            Key={'tenant_id': tenant_id},
+            ConditionExpression=Attr('tenant_id').exists() & (Attr('onboarding_step').not_exists() | Attr('onboarding_step').lt(step)),
+            ReturnValues='ALL_NEW',
+            **update_params({**updates, 'onboarding_step': step})
+        )
+    except tenants_table.meta.client.exceptions.ConditionalCheckFailedException:
+        # Revisiting an earlier step leaves progress alone
+        try:
+            response = tenants_table.update_item(
+                Key={'tenant_id': tenant_id},
+                ConditionExpression=Attr('tenant_id').exists(),
+                ReturnValues='ALL_NEW',
+                **update_params(updates)
+            )
+        except tenants_table.meta.client.exceptions.ConditionalCheckFailedException:
+            return None
+    return response['Attributes']
+
 def update_onboarding_step(tenant_id, step_data):
     """Update a specific onboarding step"""
-    logger.info(f"Updating onboarding step for {tenant_id}: {step_data}")
-    
-    table = dynamodb.Table(TENANTS_TABLE)
-    response = table.get_item(Key={'tenant_id': tenant_id})
-    tenant = response.get('Item', {})
-    
-    if not tenant:
-        return cors_response(404, {'error': 'Tenant not found'})
+    logger.info("Updating onboarding step for %s: %s", tenant_id, step_data)
     
     step = step_data.get('step')
     data = step_data.get('data', {})
     
-    # Update the appropriate section based on step
-    if step == 1:  # Organization
-        tenant['organization'].update(data)
-    elif step == 2:  # Contacts
-        tenant['contacts'].update(data)
-    elif step == 3:  # AWS Accounts
-        tenant['aws_accounts'].update(data)
-    elif step == 4:  # IAM Role
-        tenant['iam_role_config'].update(data)
-    elif step == 5:  # Compliance
-        tenant['compliance'].update(data)
-    elif step == 6:  # Preferences
-        tenant['preferences'].update(data)
-    elif step == 7:  # KSI Selection
-        tenant['enabled_ksis'] = data.get('enabled_ksis', [])
-        tenant['ksi_schedule'] = data.get('ksi_schedule', 'daily')
-    
-    # Update step progress
-    tenant['onboarding_step'] = max(tenant.get('onboarding_step', 1), step)
-    tenant['last_updated'] = datetime.now(timezone.utc).isoformat()
-    
-    table.put_item(Item=tenant)
+    # Only the fields submitted for this step are written
+    updates = {'last_updated': datetime.now(timezone.utc).isoformat()}
+    section = ONBOARDING_STEP_SECTIONS.get(step)
+    if step == 7:  # KSI Selection
+        updates['enabled_ksis'] = data.get('enabled_ksis', [])
+        updates['enabled_ksis_count'] = len(updates['enabled_ksis'])
+        updates['ksi_schedule'] = data.get('ksi_schedule', 'daily')
+    
+    try:
+        section_updates = {(section, key): value for key, value in data.items()} if section else {}
+        tenant = write_onboarding_updates(tenant_id, {**updates, **section_updates}, step)
+    except ClientError as e:
+        # Tenants created without onboarding have no section map to set fields in; create it
+        if not section or e.response['Error']['Code'] != 'ValidationException':
+            raise
+        tenant = write_onboarding_updates(tenant_id, {**updates, section: data}, step)
+    
+    if tenant is None:
+        return cors_response(404, TENANT_NOT_FOUND_BODY)
     
     return cors_response(200, {
         'message': f'Step {step} updated successfully',
         'current_step': tenant['onboarding_step'],
         'next_step_requirements': get_next_step_requirements(tenant, step),
-        'tenant': tenant
+        'tenant': onboarding_tenant_summary(tenant)
     })
 
 def get_onboarding_status(tenant_id):
     """Get current onboarding status"""
-    table = dynamodb.Table(TENANTS_TABLE)
-    response = table.get_item(Key={'tenant_id': tenant_id})
+    response = tenants_table.get_item(Key={'tenant_id': tenant_id}, **projection_params(ONBOARDING_SUMMARY_FIELDS))
     tenant = response.get('Item', {})
     
     if not tenant:
-        return cors_response(404, {'error': 'Tenant not found'})
+        return cors_response(404, TENANT_NOT_FOUND_BODY)
     
     return cors_response(200, {
         'tenant_id': tenant_id,
         'status': tenant.get('status', 'unknown'),
         'current_step': tenant.get('onboarding_step', 1),
         'next_step_requirements': get_next_step_requirements(tenant, tenant.get('onboarding_step', 1)),
-        'tenant': tenant
+        'tenant': onboarding_tenant_summary(tenant)
     })
 
 def generate_iam_role_instructions(tenant_id):
     """Generate IAM role setup instructions"""
-    table = dynamodb.Table(TENANTS_TABLE)
-    response = table.get_item(Key={'tenant_id': tenant_id})
+    response = tenants_table.get_item(Key={'tenant_id': tenant_id}, **projection_params(TENANT_ACCOUNT_FIELDS))
     tenant = response.get('Item', {})
     
     if not tenant:
-        return cors_response(404, {'error': 'Tenant not found'})
+        return cors_response(404, TENANT_NOT_FOUND_BODY)
     
     # Generate external ID if not exists
     if not tenant.get('aws_accounts', {}).get('external_id'):
         external_id = f"ksi-{uuid.uuid4().hex[:16]}"
-        tenant['aws_accounts'] = tenant.get('aws_accounts', {})
-        tenant['aws_accounts']['external_id'] = external_id
-        table.put_item(Item=tenant)
+        if 'aws_accounts' in tenant:
+            updates = {'aws_accounts.external_id': external_id}
+        else:
+            updates = {'aws_accounts': {'external_id': external_id}}
+        tenants_table.update_item(Key={'tenant_id': tenant_id}, **update_params(updates))
     else:
         external_id = tenant['aws_accounts']['external_id']
     
+    return cors_response(200, build_iam_role_instructions_body(tenant_id, external_id))
+
+@lru_cache(maxsize=128)
+def build_iam_role_instructions_body(tenant_id: str, external_id: str) -> str:
+    """Encoded IAM setup instructions; they depend only on the tenant and its external ID"""
     instructions = {
         'role_name': 'KSIValidationRole',
         'external_id': external_id,
@@ -483,20 +772,34 @@ def generate_iam_role_instructions(tenant_id):
         ]
     }
     
-    return cors_response(200, {
+    return encode_json({
         'instructions': instructions,
         'external_id': external_id,
         'tenant_id': tenant_id
     })
 
+def record_connection_test(tenant_id, role_status):
+    """Store the outcome of a cross-account connection test on the tenant"""
+    try:
+        tenants_table.update_item(
+            Key={'tenant_id': tenant_id},
+            ConditionExpression=Attr('tenant_id').exists(),
+            **update_params({
+                'aws_accounts.role_status': role_status,
+                'aws_accounts.last_connection_test': datetime.now(timezone.utc).isoformat()
+            })
+        )
+    except tenants_table.meta.client.exceptions.ConditionalCheckFailedException:
+        # Deleted while the test ran; do not recreate it as a bare aws_accounts item
+        logger.warning("Tenant %s no longer exists; connection test result not stored", tenant_id)
+
 def test_cross_account_connection(tenant_id):
     """Test cross-account IAM role connection"""
-    table = dynamodb.Table(TENANTS_TABLE)
-    response = table.get_item(Key={'tenant_id': tenant_id})
+    response = tenants_table.get_item(Key={'tenant_id': tenant_id}, **projection_params(TENANT_ACCOUNT_FIELDS))
     tenant = response.get('Item', {})
     
     if not tenant:
-        return cors_response(404, {'error': 'Tenant not found'})
+        return cors_response(404, TENANT_NOT_FOUND_BODY)
     
     role_arn = tenant.get('aws_accounts', {}).get('cross_account_role_arn')
     external_id = tenant.get('aws_accounts', {}).get('external_id')
@@ -508,8 +811,6 @@ def test_cross_account_connection(tenant_id):
     
     try:
         # Test STS assume role
-        sts_client = boto3.client('sts')
-        
         assume_role_params = {
             'RoleArn': role_arn,
             'RoleSessionName': f'KSIValidationTest-{int(datetime.now().timestamp())}'
@@ -545,9 +846,7 @@ def test_cross_account_connection(tenant_id):
         })
         
         # Update tenant with successful connection
-        tenant['aws_accounts']['role_status'] = 'verified'
-        tenant['aws_accounts']['last_connection_test'] = datetime.now(timezone.utc).isoformat()
-        table.put_item(Item=tenant)
+        record_connection_test(tenant_id, 'verified')
         
         return cors_response(200, {
             'status': 'success',
@@ -572,9 +871,7 @@ def test_cross_account_connection(tenant_id):
             error_advice = "The IAM role does not exist. Please create it using the provided instructions."
         
         # Update tenant with failed connection
-        tenant['aws_accounts']['role_status'] = 'failed'
-        tenant['aws_accounts']['last_connection_test'] = datetime.now(timezone.utc).isoformat()
-        table.put_item(Item=tenant)
+        record_connection_test(tenant_id, 'failed')
         
         return cors_response(400, {
             'status': 'failed',
@@ -585,14 +882,13 @@ def test_cross_account_connection(tenant_id):
 
 def complete_tenant_onboarding(tenant_id):
     """Complete the onboarding process and activate tenant"""
-    logger.info(f"Completing onboarding for tenant {tenant_id}")
+    logger.info("Completing onboarding for tenant %s", tenant_id)
     
-    table = dynamodb.Table(TENANTS_TABLE)
-    response = table.get_item(Key={'tenant_id': tenant_id})
+    response = tenants_table.get_item(Key={'tenant_id': tenant_id})
     tenant = response.get('Item', {})
     
     if not tenant:
-        return cors_response(404, {'error': 'Tenant not found'})
+        return cors_response(404, TENANT_NOT_FOUND_BODY)
     
     if tenant.get('status') != 'onboarding':
         return cors_response(400, {'error': 'Tenant is not in onboarding status'})
@@ -635,28 +931,40 @@ def complete_tenant_onboarding(tenant_id):
         })
     
     # All validations passed - activate tenant
-    tenant['status'] = 'active'
-    tenant['onboarding_step'] = 7
-    tenant['last_updated'] = datetime.now(timezone.utc).isoformat()
-    tenant['activated_date'] = datetime.now(timezone.utc).isoformat()
+    now_iso = datetime.now(timezone.utc).isoformat()
+    updates = {
+        'status': 'active',
+        'onboarding_step': 7,
+        'last_updated': now_iso,
+        'activated_date': now_iso
+    }
     
     # Ensure KSIs are selected
     if not tenant.get('enabled_ksis'):
         # Default to all available KSIs if none selected
-        available_ksis_response = get_ksi_defaults()
-        available_ksis_data = json.loads(available_ksis_response['body'])
-        tenant['enabled_ksis'] = [ksi['ksi_id'] for ksi in available_ksis_data['available_ksis']]
+        updates['enabled_ksis'] = list_ksi_ids()
+    updates['enabled_ksis_count'] = len(updates.get('enabled_ksis', tenant.get('enabled_ksis', [])))
     
-    table.put_item(Item=tenant)
+    # Guard against a concurrent completion between the read and this write
+    try:
+        response = tenants_table.update_item(
+            Key={'tenant_id': tenant_id},
+            ConditionExpression=Attr('status').eq('onboarding'),
+            ReturnValues='ALL_NEW',
+            **update_params(updates)
+        )
+    except tenants_table.meta.client.exceptions.ConditionalCheckFailedException:
+        return cors_response(400, {'error': 'Tenant is not in onboarding status'})
+    tenant = response['Attributes']
     
-    logger.info(f"Tenant {tenant_id} onboarding completed successfully")
+    logger.info("Tenant %s onboarding completed successfully", tenant_id)
     
     return cors_response(200, {
         'status': 'success',
         'message': 'Tenant onboarding completed successfully',
         'tenant_id': tenant_id,
         'enabled_ksis': tenant['enabled_ksis'],
-        'tenant': tenant
+        'tenant': onboarding_tenant_summary(tenant)
     })
 
 def get_next_step_requirements(tenant, current_step):
@@ -664,79 +972,129 @@ def get_next_step_requirements(tenant, current_step):
     if current_step >= 7:
         return "Onboarding complete"
     
-    requirements = {
-        1: "Organization name and type are required",
-        2: "Primary contact information is required", 
-        3: "AWS account ID and primary region are required",
-        4: "Cross-account IAM role must be created and verified",
-        5: "FedRAMP compliance level and status are required",
-        6: "Notification preferences must be configured",
-        7: "Review all information and select KSIs to enable"
-    }
-    
-    return requirements.get(current_step + 1, "Unknown step")
+    return ONBOARDING_STEP_REQUIREMENTS.get(current_step + 1, "Unknown step")
 
 # ============================================================================
 # EXISTING FUNCTIONS - KSI DEFAULTS, TENANTS, ETC.
 # ============================================================================
 
+def load_ksi_defaults() -> dict:
+    """KSI definitions and automation summary, rebuilt once the warm-container cache expires"""
+    if KSI_DEFAULTS_CACHE['payload'] is not None and time.monotonic() < KSI_DEFAULTS_CACHE['expires_at']:
+        return KSI_DEFAULTS_CACHE['payload']
+    
+    items = list(scan_table_items(
+        VALIDATION_RULES_TABLE,
+        raw=True,
+        **projection_params(KSI_DEFAULT_FIELDS + STEP_SUMMARY_FIELDS)
+    ))
+    
+    # Rules written before the step counters existed still need their steps read once
+    legacy_keys = [
+        {'rule_id': raw_item['rule_id']} for raw_item in items
+        if 'validation_steps_count' not in raw_item and 'rule_id' in raw_item
+    ]
+    legacy_step_summaries = {}
+    if legacy_keys:
+        legacy_items = batch_get_raw_items(
+            VALIDATION_RULES_TABLE,
+            legacy_keys,
+            **projection_params(('rule_id', 'validation_steps'))
+        )
+        for raw_item in legacy_items:
+            # Steps are only counted and inspected for keys, so never deserialize them
+            validation_steps = raw_item.get('validation_steps', {}).get('L', [])
+            legacy_step_summaries[raw_item['rule_id']['S']] = (len(validation_steps), has_cli_steps(validation_steps))
+    
+    available_ksis = []
+    automation_counts = Counter()
+    for raw_item in items:
+        item = plain_item(raw_item, KSI_DEFAULT_FIELDS + STEP_SUMMARY_FIELDS)
+        
+        if 'validation_steps_count' in item:
+            steps_count = item['validation_steps_count']
+            has_cli = item.get('has_cli_steps', False)
+        else:
+            steps_count, has_cli = legacy_step_summaries.get(item.get('rule_id'), (0, False))
+        
+        # Determine automation type
+        automation_type = item.get('automation_type', 'manual')
+        
+        if steps_count and not automation_type:
+            automation_type = 'fully_automated' if has_cli else 'manual'
+        
+        ksi_info = {
+            'ksi_id': item.get('ksi_id') or item.get('rule_id'),
+            'title': item.get('title', 'Unknown KSI'),
+            'category': item.get('category', 'Unknown'),
+            'automation_type': automation_type,
+            'validation_steps': steps_count,
+            'description': item.get('description', ''),
+            'compliance_framework': item.get('compliance_framework', 'FedRAMP-20x')
+        }
+        available_ksis.append(ksi_info)
+        automation_counts[automation_type] += 1
+    
+    available_ksis.sort(key=itemgetter('ksi_id'))
+    
+    payload = {
+        'available_ksis': available_ksis,
+        'total_count': len(available_ksis),
+        'automation_summary': {
+            'fully_automated': automation_counts['fully_automated'],
+            'partially_automated': automation_counts['partially_automated'],
+            'manual': automation_counts['manual']
+        }
+    }
+    
+    # The encoded response is cached alongside; rules change on admin timescales
+    KSI_DEFAULTS_CACHE['payload'] = payload
+    KSI_DEFAULTS_CACHE['response'] = cors_response(200, payload)
+    KSI_DEFAULTS_CACHE['expires_at'] = time.monotonic() + KSI_DEFAULTS_CACHE_TTL_SECONDS
+    
+    return payload
+
+def list_ksi_ids() -> list:
+    """Sorted IDs of every KSI, from the ksi-defaults cache or an ID-only rules scan"""
+    if KSI_DEFAULTS_CACHE['payload'] is not None and time.monotonic() < KSI_DEFAULTS_CACHE['expires_at']:
+        return [ksi['ksi_id'] for ksi in KSI_DEFAULTS_CACHE['payload']['available_ksis']]
+    
+    # rule_id is the table key, so every rule has one to fall back on
+    return sorted(
+        (raw_item.get('ksi_id') or raw_item['rule_id'])['S']
+        for raw_item in scan_table_items(VALIDATION_RULES_TABLE, raw=True, **projection_params(('ksi_id', 'rule_id')))
+    )
+
 def get_ksi_defaults():
-    """Get all available KSI definitions"""
+    """Get all available KSI definitions, served from the warm-container cache when fresh"""
     try:
-        rules_table = dynamodb.Table(VALIDATION_RULES_TABLE)
-        response = rules_table.scan()
-        
-        available_ksis = []
-        for item in response.get('Items', []):
-            # Determine automation type
-            validation_steps = item.get('validation_steps', [])
-            automation_type = item.get('automation_type', 'manual')
-            
-            if validation_steps and not automation_type:
-                has_cli = any('service' in step and 'action' in step for step in validation_steps)
-                automation_type = 'fully_automated' if has_cli else 'manual'
-            
-            ksi_info = {
-                'ksi_id': item.get('ksi_id') or item.get('rule_id'),
-                'title': item.get('title', 'Unknown KSI'),
-                'category': item.get('category', 'Unknown'),
-                'automation_type': automation_type,
-                'validation_steps': len(validation_steps),
-                'description': item.get('description', ''),
-                'compliance_framework': item.get('compliance_framework', 'FedRAMP-20x')
-            }
-            available_ksis.append(ksi_info)
-        
-        available_ksis.sort(key=lambda x: x['ksi_id'])
-        
-        return cors_response(200, {
-            'available_ksis': available_ksis,
-            'total_count': len(available_ksis),
-            'automation_summary': {
-                'fully_automated': len([k for k in available_ksis if k['automation_type'] == 'fully_automated']),
-                'partially_automated': len([k for k in available_ksis if k['automation_type'] == 'partially_automated']),
-                'manual': len([k for k in available_ksis if k['automation_type'] == 'manual'])
-            }
-        })
+        load_ksi_defaults()
+        return dict(KSI_DEFAULTS_CACHE['response'])
         
     except Exception as e:
-        logger.error(f"Error getting KSI defaults: {str(e)}")
+        logger.error("Error getting KSI defaults: %s", e)
         return cors_response(500, {'error': str(e)})
 
 def get_all_tenants():
     """Get all tenants"""
     try:
-        tenants_table = dynamodb.Table(TENANTS_TABLE)
-        response = tenants_table.scan()
+        items = list(scan_table_items(TENANTS_TABLE, **projection_params(TENANT_LIST_FIELDS)))
+        
+        # Tenants written before the counter existed have their KSI list read once to count it
+        legacy_counts = {}
+        legacy_keys = [{'tenant_id': {'S': item['tenant_id']}} for item in items if 'enabled_ksis_count' not in item]
+        if legacy_keys:
+            for raw_item in batch_get_raw_items(TENANTS_TABLE, legacy_keys, **projection_params(('tenant_id', 'enabled_ksis'))):
+                legacy_counts[raw_item['tenant_id']['S']] = len(raw_item.get('enabled_ksis', {}).get('L', []))
         
         tenants = []
-        for item in response.get('Items', []):
+        for item in items:
             tenant_info = {
                 'tenant_id': item.get('tenant_id'),
                 'tenant_name': item.get('organization', {}).get('name', 'Unknown'),
                 'status': item.get('status', 'active'),
                 'onboarding_step': item.get('onboarding_step', 0),
-                'enabled_ksis_count': len(item.get('enabled_ksis', [])),
+                'enabled_ksis_count': item['enabled_ksis_count'] if 'enabled_ksis_count' in item else legacy_counts.get(item['tenant_id'], 0),
                 'created_date': item.get('created_date')
             }
             tenants.append(tenant_info)
@@ -744,7 +1102,7 @@ def get_all_tenants():
         return cors_response(200, {'tenants': tenants})
         
     except Exception as e:
-        logger.error(f"Error getting tenants: {str(e)}")
+        logger.error("Error getting tenants: %s", e)
         return cors_response(500, {'error': str(e)})
 
 def create_tenant(tenant_data):
@@ -757,11 +1115,11 @@ def create_tenant(tenant_data):
             'organization': {'name': tenant_data.get('tenant_name', 'New Tenant')},
             'status': 'active',
             'enabled_ksis': [],
+            'enabled_ksis_count': 0,
             'created_date': datetime.now(timezone.utc).isoformat()
         }
         
-        tenants_table = dynamodb.Table(TENANTS_TABLE)
-        tenants_table.put_item(Item=tenant_record)
+        tenant_id = put_new_tenant(tenant_record)
         
         return cors_response(201, {
             'message': 'Tenant created successfully',
@@ -769,75 +1127,73 @@ def create_tenant(tenant_data):
         })
         
     except Exception as e:
-        logger.error(f"Error creating tenant: {str(e)}")
+        logger.error("Error creating tenant: %s", e)
         return cors_response(500, {'error': str(e)})
 
 def get_tenant_details(tenant_id):
     """Get tenant details - WITH DEBUG LOGGING"""
     try:
-        logger.info(f"🔍 get_tenant_details called for tenant_id: {tenant_id}")
+        logger.info("🔍 get_tenant_details called for tenant_id: %s", tenant_id)
         
-        tenants_table = dynamodb.Table(TENANTS_TABLE)
-        logger.info(f"🔍 DynamoDB table: {TENANTS_TABLE}")
+        logger.info("🔍 DynamoDB table: %s", TENANTS_TABLE)
         
-        logger.info(f"🔍 Calling get_item with Key: {{'tenant_id': '{tenant_id}'}}")
+        logger.info("🔍 Calling get_item with Key: {'tenant_id': '%s'}", tenant_id)
         response = tenants_table.get_item(Key={'tenant_id': tenant_id})
-        logger.info(f"🔍 DynamoDB response keys: {list(response.keys())}")
+        logger.info("🔍 DynamoDB response keys: %s", list(response.keys()))
         
         if 'Item' in response:
             tenant_item = response['Item']
-            logger.info(f"🔍 Found tenant item with keys: {list(tenant_item.keys())}")
-            logger.info(f"🔍 Tenant organization: {tenant_item.get('organization', {})}")
-            logger.info(f"🔍 Tenant enabled_ksis count: {len(tenant_item.get('enabled_ksis', []))}")
+            logger.info("🔍 Found tenant item with keys: %s", list(tenant_item.keys()))
+            logger.info("🔍 Tenant organization: %s", tenant_item.get('organization', {}))
+            logger.info("🔍 Tenant enabled_ksis count: %s", len(tenant_item.get('enabled_ksis', [])))
             
             return cors_response(200, {'tenant': tenant_item})
         else:
-            logger.info(f"🔍 No Item found in response for tenant_id: {tenant_id}")
-            return cors_response(404, {'error': 'Tenant not found'})
+            logger.info("🔍 No Item found in response for tenant_id: %s", tenant_id)
+            return cors_response(404, TENANT_NOT_FOUND_BODY)
             
     except Exception as e:
-        logger.error(f"❌ Error in get_tenant_details: {str(e)}")
-        logger.error(f"❌ Exception type: {type(e)}")
+        logger.error("❌ Error in get_tenant_details: %s", e)
+        logger.error("❌ Exception type: %s", type(e))
         import traceback
-        logger.error(f"❌ Full traceback: {traceback.format_exc()}")
+        logger.error("❌ Full traceback: %s", traceback.format_exc())
         return cors_response(500, {'error': str(e)})
 
 def update_tenant(tenant_id, tenant_data):
     """Update tenant"""
     try:
-        tenants_table = dynamodb.Table(TENANTS_TABLE)
-        
-        # Get current tenant
-        response = tenants_table.get_item(Key={'tenant_id': tenant_id})
-        tenant = response.get('Item', {})
-        
-        if not tenant:
-            return cors_response(404, {'error': 'Tenant not found'})
-        
-        # Update fields
-        for key, value in tenant_data.items():
-            if key != 'tenant_id':  # Don't update the key
-                tenant[key] = value
-        
-        tenant['last_updated'] = datetime.now(timezone.utc).isoformat()
-        tenants_table.put_item(Item=tenant)
+        # Client keys are single attribute names, never paths, so each is passed as a one-part tuple
+        updates = {(key,): value for key, value in tenant_data.items() if key != 'tenant_id'}  # Don't update the key
+        if 'enabled_ksis' in tenant_data:
+            updates[('enabled_ksis_count',)] = len(tenant_data['enabled_ksis'] or [])
+        updates[('last_updated',)] = datetime.now(timezone.utc).isoformat()
+        
+        # One conditional UpdateItem in place of get_item + put_item
+        try:
+            response = tenants_table.update_item(
+                Key={'tenant_id': tenant_id},
+                ConditionExpression=Attr('tenant_id').exists(),
+                ReturnValues='ALL_NEW',
+                **update_params(updates)
+            )
+        except tenants_table.meta.client.exceptions.ConditionalCheckFailedException:
+            return cors_response(404, TENANT_NOT_FOUND_BODY)
         
-        return cors_response(200, {'message': 'Tenant updated successfully', 'tenant': tenant})
+        return cors_response(200, {'message': 'Tenant updated successfully', 'tenant': response['Attributes']})
         
     except Exception as e:
-        logger.error(f"Error updating tenant: {str(e)}")
+        logger.error("Error updating tenant: %s", e)
         return cors_response(500, {'error': str(e)})
 
 def delete_tenant(tenant_id):
     """Delete tenant"""
     try:
-        tenants_table = dynamodb.Table(TENANTS_TABLE)
         tenants_table.delete_item(Key={'tenant_id': tenant_id})
         
         return cors_response(200, {'message': 'Tenant deleted successfully'})
         
     except Exception as e:
-        logger.error(f"Error deleting tenant: {str(e)}")
+        logger.error("Error deleting tenant: %s", e)
         return cors_response(500, {'error': str(e)})
 
 def get_system_status():
@@ -856,21 +1212,20 @@ def get_system_status():
 def update_tenant_ksi_config(tenant_id, config_data):
     """Update tenant KSI configuration - THE MISSING FUNCTION"""
     try:
-        logger.info(f"Updating KSI config for tenant: {tenant_id}")
-        logger.info(f"Config data: {config_data}")
-        
-        tenants_table = dynamodb.Table(TENANTS_TABLE)
+        logger.info("Updating KSI config for tenant: %s", tenant_id)
+        logger.info("Config data: %s", config_data)
         
         tenants_table.update_item(
             Key={'tenant_id': tenant_id},
-            UpdateExpression='SET enabled_ksis = :ksis, last_updated = :updated',
+            UpdateExpression='SET enabled_ksis = :ksis, enabled_ksis_count = :ksi_count, last_updated = :updated',
             ExpressionAttributeValues={
                 ':ksis': config_data.get('enabled_ksis', []),
+                ':ksi_count': len(config_data.get('enabled_ksis', [])),
                 ':updated': datetime.now(timezone.utc).isoformat()
             }
         )
         
-        logger.info(f"Successfully updated KSI config for {tenant_id}")
+        logger.info("Successfully updated KSI config for %s", tenant_id)
         
         return cors_response(200, {
             'message': 'KSI configuration updated successfully',
@@ -879,14 +1234,14 @@ def update_tenant_ksi_config(tenant_id, config_data):
         })
         
     except Exception as e:
-        logger.error(f"Error updating tenant KSI config: {str(e)}")
+        logger.error("Error updating tenant KSI config: %s", e)
         return cors_response(500, {'error': str(e)})
 
 # ============================================================================
 # KSI VALIDATION ROUTES
 # ============================================================================
 
-def handle_ksi_validation_routes(event, context):
+def handle_ksi_validation_routes(event, context, path_parts=None):
     """Handle KSI validation execution routes"""
     path = event.get('path', '')
     method = event.get('httpMethod', '')
@@ -894,24 +1249,135 @@ def handle_ksi_validation_routes(event, context):
     if path == '/api/ksi/validate':
         if method == 'POST':
             return trigger_ksi_validation(json.loads(event['body']))
+    else:
+        if path_parts is None:
+            path_parts = path.split('/')
+        route = KSI_ROUTES.get((method, path_parts[3] if len(path_parts) > 3 else ''))
+        if route:
+            return route(event)
+    
+    return cors_response(404, {'error': 'KSI validation route not found'})
+
+def with_step_counts(raw_items: list) -> list:
+    """Fill validation_steps_count on raw rules written before the counter existed
+
+    Only those legacy rules have their validation_steps read, in one batch.
+    """
+    legacy_keys = [{'rule_id': raw_item['rule_id']} for raw_item in raw_items if 'validation_steps_count' not in raw_item]
+    if legacy_keys:
+        step_counts = {
+            raw_item['rule_id']['S']: len(raw_item.get('validation_steps', {}).get('L', []))
+            for raw_item in batch_get_raw_items(VALIDATION_RULES_TABLE, legacy_keys, **projection_params(('rule_id', 'validation_steps')))
+        }
+        for raw_item in raw_items:
+            if 'validation_steps_count' not in raw_item:
+                raw_item['validation_steps_count'] = {'N': str(step_counts.get(raw_item['rule_id']['S'], 0))}
+    return raw_items
+
+def get_validation_rules():
+    """All validation rules, rescanned (every page) once the warm-container cache expires"""
+    if VALIDATION_RULES_CACHE['rules'] is None or time.monotonic() >= VALIDATION_RULES_CACHE['expires_at']:
+        VALIDATION_RULES_CACHE['rules'] = [
+            plain_item(raw_item)
+            for raw_item in with_step_counts(list(
+                scan_table_items(VALIDATION_RULES_TABLE, raw=True, **projection_params(VALIDATION_RULE_FIELDS))
+            ))
+        ]
+        VALIDATION_RULES_CACHE['expires_at'] = time.monotonic() + VALIDATION_RULES_CACHE_TTL_SECONDS
+    return VALIDATION_RULES_CACHE['rules']
+
+def get_rules_by_ids(requested_ids):
+    """Read the rules whose rule_id or ksi_id is in requested_ids without scanning
+
+    rule_id matches come from BatchGetItem on the table key; ksi_id matches come
+    from the ksi-version-index, which may hold several versioned rules per KSI.
+    Each id's matches are cached for VALIDATION_RULES_CACHE_TTL_SECONDS, so warm
+    containers only go to DynamoDB for ids they have not seen recently.
+    """
+    requested_ids = list(dict.fromkeys(requested_ids))
+    now = time.monotonic()
     
-    elif path.startswith('/api/ksi/results'):
-        if method == 'GET':
-            query_params = event.get('queryStringParameters') or {}
-            tenant_id = query_params.get('tenant_id')
-            return get_validation_results(tenant_id)
+    rules_for_id = {}
+    for requested_id in requested_ids:
+        entry = RULES_BY_ID_CACHE.get(requested_id)
+        if entry and entry[0] > now:
+            rules_for_id[requested_id] = entry[1]
+    missing_ids = [requested_id for requested_id in requested_ids if requested_id not in rules_for_id]
     
-    elif path.startswith('/api/ksi/executions'):
-        if method == 'GET':
-            query_params = event.get('queryStringParameters') or {}
-            tenant_id = query_params.get('tenant_id')
-            return get_execution_history(tenant_id)
+    if missing_ids:
+        projection = projection_params(VALIDATION_RULE_FIELDS)
+        
+        rules_by_id = {}
+        for raw_item in batch_get_raw_items(
+            VALIDATION_RULES_TABLE,
+            [{'rule_id': {'S': rule_id}} for rule_id in missing_ids],
+            **projection
+        ):
+            rules_by_id[raw_item['rule_id']['S']] = raw_item
+        
+        def query_ksi_rules(ksi_id):
+            return list(query_table_items(
+                VALIDATION_RULES_TABLE,
+                raw=True,
+                IndexName='ksi-version-index',
+                KeyConditionExpression='#ksi_id = :ksi_id',
+                ProjectionExpression=projection['ProjectionExpression'],
+                ExpressionAttributeNames={**projection['ExpressionAttributeNames'], '#ksi_id': 'ksi_id'},
+                ExpressionAttributeValues={':ksi_id': {'S': ksi_id}}
+            ))
+        
+        # The per-ID index queries are independent, so they run concurrently
+        with ThreadPoolExecutor(max_workers=min(VALIDATION_MAX_WORKERS, len(missing_ids))) as executor:
+            for raw_items in executor.map(query_ksi_rules, missing_ids):
+                for raw_item in raw_items:
+                    rules_by_id.setdefault(raw_item['rule_id']['S'], raw_item)
+        
+        fetched = [plain_item(raw_item) for raw_item in with_step_counts(list(rules_by_id.values()))]
+        if len(RULES_BY_ID_CACHE) + len(missing_ids) > RULES_BY_ID_CACHE_MAX_ENTRIES:
+            RULES_BY_ID_CACHE.clear()
+        expires_at = now + VALIDATION_RULES_CACHE_TTL_SECONDS
+        for requested_id in missing_ids:
+            # Misses are cached too, so an unknown id is not re-queried on every request
+            matches = [rule for rule in fetched if requested_id in (rule.get('rule_id'), rule.get('ksi_id'))]
+            RULES_BY_ID_CACHE[requested_id] = (expires_at, matches)
+            rules_for_id[requested_id] = matches
     
-    return cors_response(404, {'error': 'KSI validation route not found'})
+    # A rule can match one id by rule_id and another by ksi_id; return it once
+    rules = {}
+    for requested_id in requested_ids:
+        for rule in rules_for_id[requested_id]:
+            rules.setdefault(rule['rule_id'], rule)
+    return list(rules.values())
+
+def run_ksi_validation(ksi_rule, execution_id, tenant_id):
+    """Validate one KSI rule and build its result record (timestamped by the caller).
+
+    Runs on a worker thread; evidence collection added here must create its
+    own boto3 session rather than share the module-level clients.
+    """
+    ksi_id = ksi_rule.get('ksi_id') or ksi_rule.get('rule_id')
+    
+    # For MVP, simulate validation with mix of pass/fail
+    # In production, this would execute real AWS CLI commands
+    assertion = _RNG.random() < SIMULATED_PASS_RATE
+    steps_count = ksi_rule.get('validation_steps_count', 0)
+    
+    return {
+        'ksi_id': ksi_id,
+        'execution_id': execution_id,
+        'tenant_id': tenant_id,
+        'assertion': assertion,
+        'assertion_reason': f"✅ {ksi_rule.get('title', ksi_id)} validation passed" if assertion else f"❌ {ksi_rule.get('title', ksi_id)} validation failed",
+        'commands_executed': steps_count,
+        'successful_commands': steps_count if assertion else 0,
+        'failed_commands': 0 if assertion else steps_count,
+        'category': ksi_rule.get('category', 'Unknown'),
+        'record_type': 'result'
+    }
 
 def trigger_ksi_validation(validation_request):
     """Execute KSI validation for a single tenant"""
-    logger.info(f"Triggering KSI validation: {validation_request}")
+    logger.info("Triggering KSI validation: %s", validation_request)
     
     try:
         tenant_id = validation_request.get('tenant_id')
@@ -923,74 +1389,63 @@ def trigger_ksi_validation(validation_request):
         if not tenant_id:
             return cors_response(400, {'error': 'tenant_id is required'})
         
-        execution_id = f"exec-{int(datetime.now(timezone.utc).timestamp())}-{uuid.uuid4().hex[:8]}"
-        logger.info(f"Starting validation execution: {execution_id} for tenant: {tenant_id}")
+        started_at = datetime.now(timezone.utc)
+        execution_id = f"exec-{int(started_at.timestamp())}-{uuid.uuid4().hex[:8]}"
+        logger.info("Starting validation execution: %s for tenant: %s", execution_id, tenant_id)
         
         # Get KSI validation rules from database
-        rules_table = dynamodb.Table(VALIDATION_RULES_TABLE)
-        response = rules_table.scan()
-        available_ksis = response.get('Items', [])
-        
-        logger.info(f"Found {len(available_ksis)} KSI rules in database")
-        
-        # Filter KSIs if specified
-        if ksi_filter and not validate_all:
-            available_ksis = [ksi for ksi in available_ksis if ksi.get('ksi_id') in ksi_filter or ksi.get('rule_id') in ksi_filter]
-            logger.info(f"Filtered to {len(available_ksis)} KSIs by ID: {ksi_filter}")
+        rules_cached = VALIDATION_RULES_CACHE['rules'] is not None and time.monotonic() < VALIDATION_RULES_CACHE['expires_at']
+        if ksi_filter and not validate_all and not rules_cached and len(ksi_filter) <= TARGETED_RULE_LOOKUP_MAX_IDS:
+            available_ksis = get_rules_by_ids(ksi_filter)
+            logger.info("Loaded %s KSI rules by ID: %s", len(available_ksis), ksi_filter)
+        else:
+            available_ksis = get_validation_rules()
+            
+            logger.info("Found %s KSI rules in database", len(available_ksis))
+            
+            # Filter KSIs if specified
+            if ksi_filter and not validate_all:
+                requested_ids = frozenset(ksi_filter)
+                available_ksis = [ksi for ksi in available_ksis if ksi.get('ksi_id') in requested_ids or ksi.get('rule_id') in requested_ids]
+                logger.info("Filtered to %s KSIs by ID: %s", len(available_ksis), ksi_filter)
         
         # Filter by categories for weekly runs
         if ksi_categories:
             available_ksis = [ksi for ksi in available_ksis if ksi.get('category') in ksi_categories]
-            logger.info(f"Filtered to {len(available_ksis)} KSIs by categories: {ksi_categories}")
+            logger.info("Filtered to %s KSIs by categories: %s", len(available_ksis), ksi_categories)
         
         if not available_ksis:
             return cors_response(400, {'error': 'No KSI rules found to validate'})
         
         # Create execution summary record
-        executions_table = dynamodb.Table(EXECUTIONS_TABLE)
         execution_record = {
             'execution_id': execution_id,
             'tenant_id': tenant_id,
             'trigger_source': trigger_source,
             'status': 'completed',
             'ksis_validated': len(available_ksis),
-            'timestamp': datetime.now(timezone.utc).isoformat(),
+            'timestamp': started_at.isoformat(),
             'record_type': 'execution_summary'
         }
-        executions_table.put_item(Item=execution_record)
-        logger.info(f"Created execution summary record")
         
-        # Execute validation for each KSI and store results
+        # Summary and per-KSI results go out as BatchWriteItem calls of up to 25 items
         validation_results = []
-        for ksi_rule in available_ksis:
-            ksi_id = ksi_rule.get('ksi_id') or ksi_rule.get('rule_id')
-            
-            # For MVP, simulate validation with mix of pass/fail
-            # In production, this would execute real AWS CLI commands
-            import random
-            assertion = random.choice([True, True, True, False])  # 75% pass rate
+        with executions_table.batch_writer(overwrite_by_pkeys=['execution_id', 'timestamp']) as writer:
+            writer.put_item(Item=execution_record)
+            logger.info("Queued execution summary record")
             
-            result = {
-                'ksi_id': ksi_id,
-                'execution_id': execution_id,
-                'tenant_id': tenant_id,
-                'assertion': assertion,
-                'assertion_reason': f"✅ {ksi_rule.get('title', ksi_id)} validation passed" if assertion else f"❌ {ksi_rule.get('title', ksi_id)} validation failed",
-                'timestamp': datetime.now(timezone.utc).isoformat(),
-                'commands_executed': len(ksi_rule.get('validation_steps', [])),
-                'successful_commands': len(ksi_rule.get('validation_steps', [])) if assertion else 0,
-                'failed_commands': 0 if assertion else len(ksi_rule.get('validation_steps', [])),
-                'category': ksi_rule.get('category', 'Unknown'),
-                'record_type': 'result'
-            }
-            
-            # Store result in DynamoDB
-            executions_table.put_item(Item=result)
-            validation_results.append(result)
-            
-            logger.info(f"Stored validation result for {ksi_id}: {'PASS' if assertion else 'FAIL'}")
-        
-        logger.info(f"Completed validation execution {execution_id} with {len(validation_results)} results")
+            # Validate KSIs concurrently; results are written from this thread only
+            # since batch_writer is not thread-safe
+            with ThreadPoolExecutor(max_workers=min(VALIDATION_MAX_WORKERS, len(available_ksis))) as executor:
+                for result in executor.map(lambda ksi_rule: run_ksi_validation(ksi_rule, execution_id, tenant_id), available_ksis):
+                    # Stamped serially so timestamps (the sort key) stay unique within the execution
+                    result['timestamp'] = datetime.now(timezone.utc).isoformat()
+                    writer.put_item(Item=result)
+                    validation_results.append(result)
+                    
+                    logger.info("Queued validation result for %s: %s", result['ksi_id'], 'PASS' if result['assertion'] else 'FAIL')
+        
+        logger.info("Completed validation execution %s with %s results", execution_id, len(validation_results))
         
         return cors_response(200, {
             'status': 'success',
@@ -1002,62 +1457,92 @@ def trigger_ksi_validation(validation_request):
         })
         
     except Exception as e:
-        logger.error(f"Error in KSI validation: {str(e)}")
+        logger.error("Error in KSI validation: %s", e)
         return cors_response(500, {'error': f'Validation failed: {str(e)}'})
 
 def get_validation_results(tenant_id):
     """Get validation results for tenant"""
     try:
-        executions_table = dynamodb.Table(EXECUTIONS_TABLE)
-        
+        # Both indexes are sorted on timestamp, so newest-first comes straight from DynamoDB
         if tenant_id:
-            response = executions_table.scan(
-                FilterExpression=Attr('tenant_id').eq(tenant_id) & Attr('record_type').eq('result')
+            items = query_table_items(
+                EXECUTIONS_TABLE,
+                raw=True,
+                IndexName='tenant-timestamp-index',
+                KeyConditionExpression='tenant_id = :tenant_id',
+                FilterExpression='record_type = :record_type',
+                ExpressionAttributeValues={':tenant_id': {'S': tenant_id}, ':record_type': {'S': 'result'}},
+                ScanIndexForward=False,
+                **projection_params(VALIDATION_RESULT_FIELDS)
             )
         else:
-            response = executions_table.scan(
-                FilterExpression=Attr('record_type').eq('result')
+            items = query_table_items(
+                EXECUTIONS_TABLE,
+                raw=True,
+                IndexName='record-type-timestamp-index',
+                KeyConditionExpression='record_type = :record_type',
+                ExpressionAttributeValues={':record_type': {'S': 'result'}},
+                ScanIndexForward=False,
+                **projection_params(VALIDATION_RESULT_FIELDS)
             )
         
-        results = response.get('Items', [])
-        results.sort(key=lambda x: x.get('timestamp', ''), reverse=True)
+        results = [plain_item(item) for item in items]
         
         return cors_response(200, {'results': results})
         
     except Exception as e:
-        logger.error(f"Error getting validation results: {str(e)}")
+        logger.error("Error getting validation results: %s", e)
         return cors_response(500, {'error': str(e)})
 
 def get_execution_history(tenant_id):
     """Get execution history"""
     try:
-        executions_table = dynamodb.Table(EXECUTIONS_TABLE)
-        
         if tenant_id:
-            response = executions_table.scan(
-                FilterExpression=Attr('tenant_id').eq(tenant_id)
+            # Newest-first from the tenant index; stop paging once a full history page is collected
+            items = query_table_items(
+                EXECUTIONS_TABLE,
+                raw=True,
+                IndexName='tenant-timestamp-index',
+                KeyConditionExpression='tenant_id = :tenant_id',
+                FilterExpression=EXECUTION_SUMMARY_FILTER,
+                ExpressionAttributeValues={':tenant_id': {'S': tenant_id}, ':record_type': {'S': 'execution_summary'}},
+                ScanIndexForward=False,
+                **projection_params(EXECUTION_SUMMARY_FIELDS)
             )
         else:
-            response = executions_table.scan()
+            # Legacy summaries have no record_type, so they are not in the record-type index;
+            # the filter still keeps result rows from being sent back
+            items = parallel_scan_items(
+                EXECUTIONS_TABLE,
+                EXECUTIONS_SCAN_SEGMENTS,
+                raw=True,
+                FilterExpression=EXECUTION_SUMMARY_FILTER,
+                ExpressionAttributeValues={':record_type': {'S': 'execution_summary'}},
+                **projection_params(EXECUTION_SUMMARY_FIELDS)
+            )
         
         executions = []
-        for item in response.get('Items', []):
-            if not item.get('record_type') or item.get('record_type') == 'execution_summary':
-                executions.append({
-                    'execution_id': item.get('execution_id'),
-                    'tenant_id': item.get('tenant_id'),
-                    'timestamp': item.get('timestamp'),
-                    'ksis_validated': item.get('ksis_validated', 0),
-                    'status': item.get('status', 'completed'),
-                    'trigger_source': item.get('trigger_source', 'unknown')
-                })
+        for raw_item in items:
+            item = plain_item(raw_item, EXECUTION_SUMMARY_FIELDS)
+            executions.append({
+                'execution_id': item.get('execution_id'),
+                'tenant_id': item.get('tenant_id'),
+                'timestamp': item.get('timestamp'),
+                'ksis_validated': item.get('ksis_validated', 0),
+                'status': item.get('status', 'completed'),
+                'trigger_source': item.get('trigger_source', 'unknown')
+            })
+            if tenant_id and len(executions) >= EXECUTION_HISTORY_LIMIT:
+                break
         
-        executions.sort(key=lambda x: x.get('timestamp', ''), reverse=True)
+        if not tenant_id:
+            # Scan order is arbitrary; keep only the newest page instead of sorting every summary
+            executions = heapq.nlargest(EXECUTION_HISTORY_LIMIT, executions, key=lambda x: x['timestamp'] or '')
         
-        return cors_response(200, {'executions': executions[:10]})
+        return cors_response(200, {'executions': executions})
         
     except Exception as e:
-        logger.error(f"Error getting execution history: {str(e)}")
+        logger.error("Error getting execution history: %s", e)
         return cors_response(500, {'error': str(e)})
 
 def handle_tenant_routes(event, context):
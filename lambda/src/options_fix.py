@@ -1,32 +1,41 @@
+# Preflight answer is the same for every path, so it is built once at import
+OPTIONS_PREFLIGHT_RESPONSE = {
+    'statusCode': 200,
+    'headers': {
+        'Access-Control-Allow-Origin': '*',
+        'Access-Control-Allow-Methods': 'GET, POST, PUT, DELETE, OPTIONS',
+        'Access-Control-Allow-Headers': 'Content-Type, Authorization, X-Requested-With',
+        'Access-Control-Max-Age': '86400',
+        'Content-Type': 'application/json'
+    },
+    'body': json.dumps({'message': 'CORS preflight successful'})
+}
+
+# Path prefix -> handler, checked in order; lambdas keep the handlers late-bound
+ROUTE_PREFIXES = (
+    ('/api/admin', lambda event, context: handle_admin_request(event, context)),
+    ('/api/tenant', lambda event, context: handle_tenant_request(event, context)),
+)
+
 def lambda_handler(event, context):
     """Main Lambda handler with enhanced CORS support"""
     
-    logger.info(f"Received event: {json.dumps(event)}")
+    # Full event dumps are DEBUG-only; at INFO the dump is never built
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Received event: %s", json.dumps(event, default=str))
     
     # Handle CORS preflight requests for ALL paths
     if event.get('httpMethod') == 'OPTIONS':
-        return {
-            'statusCode': 200,
-            'headers': {
-                'Access-Control-Allow-Origin': '*',
-                'Access-Control-Allow-Methods': 'GET, POST, PUT, DELETE, OPTIONS',
-                'Access-Control-Allow-Headers': 'Content-Type, Authorization, X-Requested-With',
-                'Access-Control-Max-Age': '86400',
-                'Content-Type': 'application/json'
-            },
-            'body': json.dumps({'message': 'CORS preflight successful'})
-        }
+        return OPTIONS_PREFLIGHT_RESPONSE
     
     path = event.get('path', '')
     method = event.get('httpMethod', '')
     
     try:
-        if path.startswith('/api/admin'):
-            return handle_admin_request(event, context)
-        elif path.startswith('/api/tenant'):
-            return handle_tenant_request(event, context)
-        else:
-            return cors_response(404, {'error': 'Route not found'})
+        for prefix, handler in ROUTE_PREFIXES:
+            if path.startswith(prefix):
+                return handler(event, context)
+        return cors_response(404, {'error': 'Route not found'})
     except Exception as e:
-        logger.error(f"Handler error: {str(e)}")
+        logger.error("Handler error: %s", e)
         return cors_response(500, {'error': str(e)})
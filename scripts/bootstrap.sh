@@ -43,12 +43,25 @@ fi
 
 # Package Lambda function
 echo "📦 Packaging Lambda function..."
+# Only the entry point ships; the patch scripts and backups in lambda/src stay local
+rm -f terraform/ksi_validator.zip
 cd lambda/src
-zip -r ../../terraform/ksi_validator.zip .
+zip ../../terraform/ksi_validator.zip handler.py
 cd ../../
 
 echo "✅ Lambda function packaged"
 
+# Package Lambda dependency layer (manylinux wheels for the python3.9 runtime)
+echo "📦 Packaging Lambda dependency layer..."
+rm -rf build/layer
+pip3 install -r lambda/requirements.txt -t build/layer/python \
+    --platform manylinux2014_x86_64 --implementation cp --python-version 3.9 --only-binary=:all:
+cd build/layer
+zip -r ../../terraform/ksi_dependencies_layer.zip python
+cd ../../
+
+echo "✅ Lambda dependency layer packaged"
+
 # Initialize Terraform
 echo "🏗️ Initializing Terraform..."
 cd terraform
@@ -4,613 +4,182 @@ Populate all 51 FedRAMP 20X KSIs into DynamoDB validation rules table
 """
 
 import boto3
+import hashlib
 import json
+import os
+import sys
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from decimal import Decimal
+from functools import lru_cache
+from pathlib import Path
+from boto3.dynamodb.types import TypeSerializer
+from botocore.config import Config
 
-def populate_all_ksis():
-    """Add all 51 KSIs to the validation rules table"""
+# BatchWriteItem takes at most 25 puts; a few concurrent batches overlap the round trips.
+# More than about 4 in flight starts to throttle a provisioned dev table.
+BATCH_WRITE_SIZE = 25
+WRITE_WORKERS = max(1, int(os.environ.get('KSI_WRITE_CONCURRENCY', '4')))
+
+# TransactWriteItems limit; an atomic load must fit in one transaction
+TRANSACT_WRITE_SIZE = 100
+
+# Bulk-load client: a socket per writer thread, kept alive, with adaptive retries that
+# rate-limit client-side on throttling instead of only backing off
+BULK_CLIENT_CONFIG = Config(
+    region_name='us-gov-west-1',
+    max_pool_connections=WRITE_WORKERS * 2,
+    retries={'max_attempts': 10, 'mode': 'adaptive'},
+    tcp_keepalive=True,
+    connect_timeout=2,
+    read_timeout=10
+)
+
+# KSI definitions live beside this script as data rather than a Python literal
+KSIS_FILE = Path(__file__).parent / 'ksis.json'
+
+@lru_cache(maxsize=1)
+def load_ksis():
+    """The KSI definitions from ksis.json, parsed once per process (numbers as DynamoDB-safe Decimals)
+
+    Each definition gets its command_count here, once, rather than on every write.
+    """
+    ksis = json.loads(KSIS_FILE.read_text(encoding='utf-8'), parse_float=Decimal)
+    for ksi in ksis:
+        ksi['command_count'] = len(ksi['commands'])
+    return ksis
+
+# Write-time bookkeeping left out of the content hash so an unchanged KSI hashes the same every run
+UNHASHED_FIELDS = ('created_date', 'last_updated', 'content_hash')
+
+def content_hash(item):
+    """sha256 of an item's content fields, stable across runs"""
+    content = {key: value for key, value in item.items() if key not in UNHASHED_FIELDS}
+    return hashlib.sha256(json.dumps(content, sort_keys=True, default=str).encode()).hexdigest()
+
+def stored_content_hashes(client, table_name, rule_ids):
+    """rule_id -> content_hash already in the table, 100 keys per BatchGetItem"""
+    hashes = {}
+    for start in range(0, len(rule_ids), 100):
+        request_items = {table_name: {
+            'Keys': [{'rule_id': {'S': rule_id}} for rule_id in rule_ids[start:start + 100]],
+            'ProjectionExpression': 'rule_id, content_hash'
+        }}
+        while request_items:
+            response = client.batch_get_item(RequestItems=request_items)
+            for raw_item in response.get('Responses', {}).get(table_name, []):
+                if 'content_hash' in raw_item:
+                    hashes[raw_item['rule_id']['S']] = raw_item['content_hash']['S']
+            request_items = response.get('UnprocessedKeys')
+    return hashes
+
+# Backoff rounds for UnprocessedItems (0.1s doubling, about 3s in all) before a batch is reported as failed
+MAX_UNPROCESSED_RETRIES = 5
+
+def write_batch(client, table_name, items):
+    """Put up to 25 wire-format items with one BatchWriteItem, retrying UnprocessedItems with exponential backoff
+
+    Throttling errors are retried by the client's adaptive mode; items still unprocessed after
+    MAX_UNPROCESSED_RETRIES backoff rounds raise rather than being dropped.
+    """
+    request_items = {table_name: [{'PutRequest': {'Item': item}} for item in items]}
+    for attempt in range(MAX_UNPROCESSED_RETRIES + 1):
+        response = client.batch_write_item(RequestItems=request_items)
+        request_items = response.get('UnprocessedItems') or {}
+        if not request_items:
+            return
+        if attempt < MAX_UNPROCESSED_RETRIES:
+            time.sleep(0.1 * 2 ** attempt)
+    raise RuntimeError(f"{len(request_items[table_name])} items still unprocessed after {MAX_UNPROCESSED_RETRIES} retries")
+
+def write_transaction(client, table_name, items):
+    """Put every wire-format item in one all-or-nothing TransactWriteItems call (2 WCUs per item)"""
+    if len(items) > TRANSACT_WRITE_SIZE:
+        raise ValueError(f"An atomic load is limited to {TRANSACT_WRITE_SIZE} items, got {len(items)}")
+    client.transact_write_items(TransactItems=[{'Put': {'TableName': table_name, 'Item': item}} for item in items])
+
+def populate_all_ksis(atomic=False):
+    """Add all 51 KSIs to the validation rules table
+
+    With atomic=True the changed KSIs are written in a single transaction, so a
+    failed load leaves the table untouched; the default batched path is cheaper.
+    """
     
-    # Initialize DynamoDB
-    dynamodb = boto3.resource('dynamodb', region_name='us-gov-west-1')
-    table = dynamodb.Table('ksi-mvp-validation-rules-dev')
+    # Initialize DynamoDB; the low-level client takes items already in wire format
+    dynamodb_client = boto3.client('dynamodb', config=BULK_CLIENT_CONFIG)
+    table_name = 'ksi-mvp-validation-rules-dev'
+    serializer = TypeSerializer()
     
     # Complete KSI definitions
-    all_ksis = [
-        # Cryptographic Evidence & Documentation (CED)
-        {
-            "ksi_id": "KSI-CED-01",
-            "title": "Cryptographic Module Validation",
-            "category": "Cryptographic Evidence & Documentation",
-            "description": "Validates FIPS 140-2 cryptographic modules and key management practices",
-            "version": "1.0",
-            "commands": [
-                {"order": 1, "command": "aws kms list-keys --query 'Keys[*].KeyId'", "description": "List KMS keys"},
-                {"order": 2, "command": "aws kms describe-key --key-id {key_id}", "description": "Check key specifications"},
-                {"order": 3, "command": "aws kms get-key-policy --key-id {key_id} --policy-name default", "description": "Verify key policies"}
-            ]
-        },
-        {
-            "ksi_id": "KSI-CED-02", 
-            "title": "Encryption in Transit",
-            "category": "Cryptographic Evidence & Documentation",
-            "description": "Validates encryption standards for data in transit across all network communications",
-            "version": "1.0",
-            "commands": [
-                {"order": 1, "command": "aws elbv2 describe-listeners --query 'Listeners[*].[Protocol,SslPolicy]'", "description": "Check load balancer encryption"},
-                {"order": 2, "command": "aws rds describe-db-instances --query 'DBInstances[*].[DBInstanceIdentifier,StorageEncrypted]'", "description": "Verify RDS encryption"}
-            ]
-        },
-        
-        # Configuration Management & Tracking (CMT)
-        {
-            "ksi_id": "KSI-CMT-01",
-            "title": "Configuration Baseline Management",
-            "category": "Configuration Management & Tracking", 
-            "description": "Validates secure configuration baselines for all system components",
-            "version": "1.0",
-            "commands": [
-                {"order": 1, "command": "aws config describe-configuration-recorders", "description": "Check AWS Config status"},
-                {"order": 2, "command": "aws config describe-compliance-by-config-rule", "description": "Review compliance status"}
-            ]
-        },
-        {
-            "ksi_id": "KSI-CMT-02",
-            "title": "Change Management Process",
-            "category": "Configuration Management & Tracking",
-            "description": "Validates change management procedures and approval workflows",
-            "version": "1.0", 
-            "commands": [
-                {"order": 1, "command": "aws cloudformation list-stacks --stack-status-filter CREATE_COMPLETE UPDATE_COMPLETE", "description": "Review infrastructure changes"}
-            ]
-        },
-        {
-            "ksi_id": "KSI-CMT-03",
-            "title": "Asset Inventory Management", 
-            "category": "Configuration Management & Tracking",
-            "description": "Validates comprehensive tracking of all IT assets and configurations",
-            "version": "1.0",
-            "commands": [
-                {"order": 1, "command": "aws ec2 describe-instances --query 'Reservations[*].Instances[*].[InstanceId,State.Name,InstanceType]'", "description": "EC2 inventory"},
-                {"order": 2, "command": "aws rds describe-db-instances --query 'DBInstances[*].[DBInstanceIdentifier,DBInstanceStatus,Engine]'", "description": "RDS inventory"}
-            ]
-        },
-        {
-            "ksi_id": "KSI-CMT-04",
-            "title": "Software Asset Management",
-            "category": "Configuration Management & Tracking",
-            "description": "Validates tracking and management of software licenses and versions",
-            "version": "1.0",
-            "commands": [
-                {"order": 1, "command": "aws ssm describe-instance-information", "description": "Check managed instances"},
-                {"order": 2, "command": "aws ssm describe-instance-patch-states", "description": "Review patch levels"}
-            ]
-        },
-        {
-            "ksi_id": "KSI-CMT-05",
-            "title": "Configuration Documentation",
-            "category": "Configuration Management & Tracking", 
-            "description": "Validates maintenance of current system architecture and configuration documentation",
-            "version": "1.0",
-            "commands": [
-                {"order": 1, "command": "aws cloudformation describe-stacks", "description": "Infrastructure documentation"},
-                {"order": 2, "command": "aws config get-resource-config-history --resource-type AWS::EC2::Instance", "description": "Configuration history"}
-            ]
-        },
-        
-        # Configuration & Network Architecture (CNA)
-        {
-            "ksi_id": "KSI-CNA-01",
-            "title": "Network Segmentation", 
-            "category": "Configuration & Network Architecture",
-            "description": "Validates proper network segmentation and isolation controls",
-            "version": "1.0",
-            "commands": [
-                {"order": 1, "command": "aws ec2 describe-vpcs", "description": "Review VPC configuration"},
-                {"order": 2, "command": "aws ec2 describe-subnets", "description": "Check subnet segmentation"},
-                {"order": 3, "command": "aws ec2 describe-security-groups", "description": "Validate security groups"}
-            ]
-        },
-        {
-            "ksi_id": "KSI-CNA-02",
-            "title": "Firewall Configuration",
-            "category": "Configuration & Network Architecture", 
-            "description": "Validates firewall rules and network access controls",
-            "version": "1.0",
-            "commands": [
-                {"order": 1, "command": "aws ec2 describe-security-groups --query 'SecurityGroups[*].[GroupId,GroupName,IpPermissions]'", "description": "Security group rules"},
-                {"order": 2, "command": "aws ec2 describe-network-acls", "description": "Network ACL configuration"}
-            ]
-        },
-        {
-            "ksi_id": "KSI-CNA-03",
-            "title": "Remote Access Security",
-            "category": "Configuration & Network Architecture",
-            "description": "Validates secure remote access methods and VPN configurations", 
-            "version": "1.0",
-            "commands": [
-                {"order": 1, "command": "aws ec2 describe-vpn-connections", "description": "Check VPN connections"},
-                {"order": 2, "command": "aws directconnect describe-connections", "description": "Review Direct Connect"}
-            ]
-        },
-        {
-            "ksi_id": "KSI-CNA-04",
-            "title": "Wireless Security Controls",
-            "category": "Configuration & Network Architecture",
-            "description": "Validates wireless network security configurations and access controls",
-            "version": "1.0", 
-            "commands": [
-                {"order": 1, "command": "echo 'Manual verification required for wireless infrastructure'", "description": "Wireless security assessment"}
-            ]
-        },
-        {
-            "ksi_id": "KSI-CNA-05",
-            "title": "Network Monitoring Capabilities",
-            "category": "Configuration & Network Architecture",
-            "description": "Validates network traffic monitoring and analysis capabilities",
-            "version": "1.0",
-            "commands": [
-                {"order": 1, "command": "aws ec2 describe-flow-logs", "description": "VPC Flow Logs status"},
-                {"order": 2, "command": "aws guardduty list-detectors", "description": "GuardDuty configuration"}
-            ]
-        },
-        {
-            "ksi_id": "KSI-CNA-06",
-            "title": "Boundary Protection Systems",
-            "category": "Configuration & Network Architecture",
-            "description": "Validates perimeter defense and boundary protection mechanisms", 
-            "version": "1.0",
-            "commands": [
-                {"order": 1, "command": "aws wafv2 list-web-acls --scope REGIONAL", "description": "WAF configuration"},
-                {"order": 2, "command": "aws shield describe-subscription", "description": "DDoS protection status"}
-            ]
-        },
-        {
-            "ksi_id": "KSI-CNA-07", 
-            "title": "Architecture Documentation",
-            "category": "Configuration & Network Architecture",
-            "description": "Validates current network architecture and topology documentation",
-            "version": "1.0",
-            "commands": [
-                {"order": 1, "command": "aws ec2 describe-route-tables", "description": "Network routing configuration"},
-                {"order": 2, "command": "aws ec2 describe-internet-gateways", "description": "Internet gateway setup"}
-            ]
-        },
-        
-        # Identity & Access Management (IAM)
-        {
-            "ksi_id": "KSI-IAM-01",
-            "title": "User Account Management",
-            "category": "Identity & Access Management",
-            "description": "Validates user provisioning, de-provisioning, and access review processes",
-            "version": "1.0",
-            "commands": [
-                {"order": 1, "command": "aws iam list-users", "description": "Review user accounts"},
-                {"order": 2, "command": "aws iam get-account-summary", "description": "Account usage summary"},
-                {"order": 3, "command": "aws iam list-access-keys", "description": "Access key inventory"}
-            ]
-        },
-        {
-            "ksi_id": "KSI-IAM-02",
-            "title": "Privileged Access Management", 
-            "category": "Identity & Access Management",
-            "description": "Validates controls for administrative and privileged account access",
-            "version": "1.0",
-            "commands": [
-                {"order": 1, "command": "aws iam list-roles --query 'Roles[?contains(RoleName, `Admin`)]'", "description": "Administrative roles"},
-                {"order": 2, "command": "aws iam list-attached-role-policies --role-name PowerUserAccess", "description": "Privileged policies"}
-            ]
-        },
-        {
-            "ksi_id": "KSI-IAM-03",
-            "title": "Multi-Factor Authentication",
-            "category": "Identity & Access Management",
-            "description": "Validates MFA implementation for all user accounts and privileged access",
-            "version": "1.0",
-            "commands": [
-                {"order": 1, "command": "aws iam get-account-summary --query 'SummaryMap.AccountMFAEnabled'", "description": "MFA enablement status"},
-                {"order": 2, "command": "aws iam list-virtual-mfa-devices", "description": "Virtual MFA devices"}
-            ]
-        },
-        {
-            "ksi_id": "KSI-IAM-04",
-            "title": "Access Control Policies",
-            "category": "Identity & Access Management", 
-            "description": "Validates least privilege principle implementation in access policies",
-            "version": "1.0",
-            "commands": [
-                {"order": 1, "command": "aws iam list-policies --scope Local", "description": "Custom policies review"},
-                {"order": 2, "command": "aws iam simulate-principal-policy", "description": "Policy simulation"}
-            ]
-        },
-        {
-            "ksi_id": "KSI-IAM-05",
-            "title": "Session Management",
-            "category": "Identity & Access Management",
-            "description": "Validates session timeout and concurrent session controls",
-            "version": "1.0",
-            "commands": [
-                {"order": 1, "command": "aws sts get-session-token --duration-seconds 3600", "description": "Session token validation"},
-                {"order": 2, "command": "aws cloudtrail lookup-events --lookup-attributes AttributeKey=EventName,AttributeValue=ConsoleLogin", "description": "Login session tracking"}
-            ]
-        },
-        {
-            "ksi_id": "KSI-IAM-06",
-            "title": "Identity Federation",
-            "category": "Identity & Access Management",
-            "description": "Validates SAML/OIDC identity provider integration and trust relationships", 
-            "version": "1.0",
-            "commands": [
-                {"order": 1, "command": "aws iam list-saml-providers", "description": "SAML providers"},
-                {"order": 2, "command": "aws iam list-open-id-connect-providers", "description": "OIDC providers"}
-            ]
-        },
-        
-        # Incident Response (INR)
-        {
-            "ksi_id": "KSI-INR-01",
-            "title": "Incident Response Plan",
-            "category": "Incident Response",
-            "description": "Validates incident response procedures and escalation processes",
-            "version": "1.0",
-            "commands": [
-                {"order": 1, "command": "aws support describe-cases --include-resolved-cases", "description": "Support case history"},
-                {"order": 2, "command": "aws logs describe-log-groups --log-group-name-prefix '/aws/lambda/incident'", "description": "Incident logging"}
-            ]
-        },
-        {
-            "ksi_id": "KSI-INR-02",
-            "title": "Security Event Detection",
-            "category": "Incident Response",
-            "description": "Validates automated security event detection and alerting capabilities",
-            "version": "1.0",
-            "commands": [
-                {"order": 1, "command": "aws guardduty get-detector", "description": "GuardDuty detection status"},
-                {"order": 2, "command": "aws securityhub get-enabled-standards", "description": "Security Hub standards"}
-            ]
-        },
-        {
-            "ksi_id": "KSI-INR-03",
-            "title": "Forensic Capabilities",
-            "category": "Incident Response",
-            "description": "Validates digital forensics and evidence collection procedures",
-            "version": "1.0", 
-            "commands": [
-                {"order": 1, "command": "aws ec2 describe-snapshots --owner-ids self", "description": "EBS snapshot capability"},
-                {"order": 2, "command": "aws cloudtrail describe-trails", "description": "Audit trail preservation"}
-            ]
-        },
-        
-        # Monitoring, Logging & Alerting (MLA) - Adding missing ones
-        {
-            "ksi_id": "KSI-MLA-03",
-            "title": "Vulnerability Detection & Remediation", 
-            "category": "Monitoring, Logging & Alerting",
-            "description": "Validates rapid detection and remediation of vulnerabilities",
-            "version": "1.0",
-            "commands": [
-                {"order": 1, "command": "aws inspector describe-assessment-runs", "description": "Vulnerability assessments"},
-                {"order": 2, "command": "aws ssm describe-instance-patch-states", "description": "Patch compliance status"}
-            ]
-        },
-        {
-            "ksi_id": "KSI-MLA-04",
-            "title": "Authenticated Vulnerability Scanning",
-            "category": "Monitoring, Logging & Alerting",
-            "description": "Validates authenticated vulnerability scanning on information resources",
-            "version": "1.0",
-            "commands": [
-                {"order": 1, "command": "aws inspector list-assessment-templates", "description": "Scanning templates"},
-                {"order": 2, "command": "aws inspector list-findings", "description": "Vulnerability findings"}
-            ]
-        },
-        {
-            "ksi_id": "KSI-MLA-05",
-            "title": "Infrastructure as Code Testing",
-            "category": "Monitoring, Logging & Alerting", 
-            "description": "Validates IaC and configuration evaluation and testing processes",
-            "version": "1.0",
-            "commands": [
-                {"order": 1, "command": "aws config describe-config-rules", "description": "Config rule evaluation"},
-                {"order": 2, "command": "aws cloudformation validate-template", "description": "Template validation"}
-            ]
-        },
-        {
-            "ksi_id": "KSI-MLA-06",
-            "title": "Vulnerability Tracking & Prioritization",
-            "category": "Monitoring, Logging & Alerting",
-            "description": "Validates centralized tracking and prioritization of vulnerability remediation",
-            "version": "1.0",
-            "commands": [
-                {"order": 1, "command": "aws securityhub get-findings", "description": "Security findings"},
-                {"order": 2, "command": "aws ssm describe-patch-group-state", "description": "Patch group status"}
-            ]
-        },
-        
-        # Policy and Inventory (PIY)
-        {
-            "ksi_id": "KSI-PIY-01",
-            "title": "Asset Inventory Management",
-            "category": "Policy and Inventory",
-            "description": "Validates complete inventories of all information resources",
-            "version": "1.0",
-            "commands": [
-                {"order": 1, "command": "aws resourcegroupstaggingapi get-resources", "description": "Tagged resource inventory"},
-                {"order": 2, "command": "aws config list-discovered-resources", "description": "Config resource discovery"}
-            ]
-        },
-        {
-            "ksi_id": "KSI-PIY-02",
-            "title": "Information Security Policies",
-            "category": "Policy and Inventory",
-            "description": "Validates organization-wide information security and technology policies",
-            "version": "1.0",
-            "commands": [
-                {"order": 1, "command": "aws iam list-policies --scope Local --query 'Policies[*].[PolicyName,Description]'", "description": "Security policies"},
-                {"order": 2, "command": "aws organizations describe-policy", "description": "Organizational policies"}
-            ]
-        },
-        {
-            "ksi_id": "KSI-PIY-03",
-            "title": "Vulnerability Disclosure Program",
-            "category": "Policy and Inventory",
-            "description": "Validates maintenance of vulnerability disclosure program",
-            "version": "1.0",
-            "commands": [
-                {"order": 1, "command": "echo 'Manual verification of vulnerability disclosure documentation required'", "description": "Disclosure program validation"}
-            ]
-        },
-        {
-            "ksi_id": "KSI-PIY-04", 
-            "title": "Secure Development Lifecycle",
-            "category": "Policy and Inventory",
-            "description": "Validates security considerations in SDLC aligned with CISA Secure By Design",
-            "version": "1.0",
-            "commands": [
-                {"order": 1, "command": "aws codebuild list-projects", "description": "Build pipeline security"},
-                {"order": 2, "command": "aws codepipeline list-pipelines", "description": "Deployment pipeline review"}
-            ]
-        },
-        {
-            "ksi_id": "KSI-PIY-05",
-            "title": "Implementation Evaluation Methods",
-            "category": "Policy and Inventory", 
-            "description": "Validates documented methods for evaluating information resource implementations",
-            "version": "1.0",
-            "commands": [
-                {"order": 1, "command": "aws config describe-conformance-packs", "description": "Conformance pack evaluation"},
-                {"order": 2, "command": "aws config describe-remediation-configurations", "description": "Remediation procedures"}
-            ]
-        },
-        {
-            "ksi_id": "KSI-PIY-06",
-            "title": "Security Staffing & Budget",
-            "category": "Policy and Inventory",
-            "description": "Validates dedicated staff and budget for security with executive support",
-            "version": "1.0",
-            "commands": [
-                {"order": 1, "command": "aws iam list-users --query 'Users[?contains(UserName, `security`)]'", "description": "Security personnel"},
-                {"order": 2, "command": "aws organizations describe-organization", "description": "Organizational structure"}
-            ]
-        },
-        {
-            "ksi_id": "KSI-PIY-07",
-            "title": "Supply Chain Risk Management",
-            "category": "Policy and Inventory",
-            "description": "Validates risk management decisions for software supply chain security",
-            "version": "1.0",
-            "commands": [
-                {"order": 1, "command": "aws ecr describe-repositories", "description": "Container registry security"},
-                {"order": 2, "command": "aws codeartifact list-repositories", "description": "Artifact repository review"}
-            ]
-        },
-        
-        # Recovery Planning (RPL)
-        {
-            "ksi_id": "KSI-RPL-01",
-            "title": "Recovery Objectives Definition",
-            "category": "Recovery Planning",
-            "description": "Validates definition of Recovery Time Objectives (RTO) and Recovery Point Objectives (RPO)",
-            "version": "1.0",
-            "commands": [
-                {"order": 1, "command": "aws rds describe-db-instances --query 'DBInstances[*].[DBInstanceIdentifier,MultiAZ,BackupRetentionPeriod]'", "description": "Database recovery configuration"},
-                {"order": 2, "command": "aws ec2 describe-snapshots --owner-ids self", "description": "Snapshot recovery capabilities"}
-            ]
-        },
-        {
-            "ksi_id": "KSI-RPL-02",
-            "title": "Recovery Plan Development",
-            "category": "Recovery Planning",
-            "description": "Validates development and maintenance of recovery plans aligned with objectives",
-            "version": "1.0",
-            "commands": [
-                {"order": 1, "command": "aws backup list-backup-plans", "description": "Backup plan configuration"},
-                {"order": 2, "command": "aws backup list-recovery-points", "description": "Recovery point inventory"}
-            ]
-        },
-        {
-            "ksi_id": "KSI-RPL-03",
-            "title": "System Backup Procedures",
-            "category": "Recovery Planning",
-            "description": "Validates system backup procedures and restoration capabilities",
-            "version": "1.0", 
-            "commands": [
-                {"order": 1, "command": "aws backup describe-backup-vault", "description": "Backup vault status"},
-                {"order": 2, "command": "aws backup list-backup-jobs", "description": "Backup job history"}
-            ]
-        },
-        {
-            "ksi_id": "KSI-RPL-04",
-            "title": "Recovery Testing Procedures",
-            "category": "Recovery Planning",
-            "description": "Validates regular testing of recovery and restoration procedures",
-            "version": "1.0",
-            "commands": [
-                {"order": 1, "command": "aws backup list-restore-jobs", "description": "Restore test history"},
-                {"order": 2, "command": "aws ec2 describe-images --owners self", "description": "Recovery image availability"}
-            ]
-        },
-        
-        # Service Configuration (SVC) - Adding missing ones
-        {
-            "ksi_id": "KSI-SVC-01",
-            "title": "Secure Service Configuration",
-            "category": "Service Configuration",
-            "description": "Validates secure configuration of all cloud services and platforms",
-            "version": "1.0",
-            "commands": [
-                {"order": 1, "command": "aws s3api get-public-access-block", "description": "S3 public access configuration"},
-                {"order": 2, "command": "aws ec2 describe-security-groups", "description": "Security group configuration"}
-            ]
-        },
-        {
-            "ksi_id": "KSI-SVC-02",
-            "title": "Service Hardening Standards",
-            "category": "Service Configuration",
-            "description": "Validates implementation of security hardening standards for all services",
-            "version": "1.0",
-            "commands": [
-                {"order": 1, "command": "aws ssm describe-instance-information", "description": "Instance compliance status"},
-                {"order": 2, "command": "aws config get-compliance-details-by-config-rule", "description": "Configuration compliance"}
-            ]
-        },
-        {
-            "ksi_id": "KSI-SVC-03",
-            "title": "Default Configuration Review",
-            "category": "Service Configuration",
-            "description": "Validates review and modification of default service configurations",
-            "version": "1.0",
-            "commands": [
-                {"order": 1, "command": "aws rds describe-db-parameter-groups", "description": "Database parameter groups"},
-                {"order": 2, "command": "aws elasticache describe-cache-parameter-groups", "description": "Cache parameter groups"}
-            ]
-        },
-        {
-            "ksi_id": "KSI-SVC-04",
-            "title": "Service Account Management",
-            "category": "Service Configuration", 
-            "description": "Validates management and security of service accounts and API keys",
-            "version": "1.0",
-            "commands": [
-                {"order": 1, "command": "aws iam list-service-specific-credentials", "description": "Service credentials"},
-                {"order": 2, "command": "aws iam list-access-keys", "description": "Access key management"}
-            ]
-        },
-        {
-            "ksi_id": "KSI-SVC-05",
-            "title": "API Security Configuration",
-            "category": "Service Configuration",
-            "description": "Validates API security configurations including authentication and rate limiting",
-            "version": "1.0",
-            "commands": [
-                {"order": 1, "command": "aws apigateway get-rest-apis", "description": "API Gateway configuration"},
-                {"order": 2, "command": "aws apigateway get-usage-plans", "description": "API usage plans and limits"}
-            ]
-        },
-        {
-            "ksi_id": "KSI-SVC-07",
-            "title": "Service Monitoring Configuration",
-            "category": "Service Configuration",
-            "description": "Validates monitoring and alerting configuration for all critical services",
-            "version": "1.0",
-            "commands": [
-                {"order": 1, "command": "aws cloudwatch describe-alarms", "description": "CloudWatch alarms"},
-                {"order": 2, "command": "aws sns list-topics", "description": "Notification topics"}
-            ]
-        },
-        
-        # Third Party Risk (TPR)
-        {
-            "ksi_id": "KSI-TPR-01",
-            "title": "Third Party Risk Assessment",
-            "category": "Third Party Risk",
-            "description": "Validates risk assessment procedures for third-party service providers",
-            "version": "1.0",
-            "commands": [
-                {"order": 1, "command": "aws marketplace describe-change-sets", "description": "Marketplace service usage"},
-                {"order": 2, "command": "aws iam list-roles --query 'Roles[?contains(AssumeRolePolicyDocument, `arn:aws:iam`)]'", "description": "Third-party role assumptions"}
-            ]
-        },
-        {
-            "ksi_id": "KSI-TPR-02",
-            "title": "Vendor Management Process",
-            "category": "Third Party Risk",
-            "description": "Validates vendor management and security assessment processes",
-            "version": "1.0",
-            "commands": [
-                {"order": 1, "command": "aws organizations list-accounts", "description": "Account relationships"},
-                {"order": 2, "command": "aws sts get-caller-identity", "description": "Current account context"}
-            ]
-        },
-        {
-            "ksi_id": "KSI-TPR-03",
-            "title": "Supply Chain Security",
-            "category": "Third Party Risk",
-            "description": "Validates software supply chain security and integrity verification",
-            "version": "1.0",
-            "commands": [
-                {"order": 1, "command": "aws ecr describe-image-scan-findings", "description": "Container image scanning"},
-                {"order": 2, "command": "aws codeartifact list-package-versions", "description": "Package version integrity"}
-            ]
-        },
-        {
-            "ksi_id": "KSI-TPR-04",
-            "title": "Third Party Monitoring",
-            "category": "Third Party Risk", 
-            "description": "Validates ongoing monitoring of third-party service security posture",
-            "version": "1.0",
-            "commands": [
-                {"order": 1, "command": "aws cloudtrail lookup-events --lookup-attributes AttributeKey=ReadOnly,AttributeValue=false", "description": "Third-party access monitoring"},
-                {"order": 2, "command": "aws iam get-account-authorization-details", "description": "External access review"}
-            ]
-        }
-    ]
+    all_ksis = load_ksis()
     
     print(f"🚀 Adding {len(all_ksis)} KSIs to validation rules table...")
     
-    # Add each KSI to DynamoDB
+    # One batched read of the stored hashes decides which KSIs need writing at all
+    stored_hashes = stored_content_hashes(dynamodb_client, table_name, [ksi['ksi_id'] for ksi in all_ksis])
+    
+    # Fields shared by every item, with one timestamp for the whole load
+    now_iso = datetime.now().isoformat()
+    item_template = {
+        'validation_steps_count': 0,  # Commands only; no API validation steps yet
+        'has_cli_steps': False,
+        'created_date': now_iso,
+        'last_updated': now_iso,
+        'status': 'active'
+    }
+    
+    items = []
+    changed_ksis = []
     for ksi in all_ksis:
-        try:
-            # Calculate command count
-            command_count = len(ksi['commands'])
-            
-            # Prepare DynamoDB item - use rule_id as primary key
-            item = {
-                'rule_id': ksi['ksi_id'],  # Use rule_id as primary key
-                'ksi_id': ksi['ksi_id'],   # Keep ksi_id for compatibility
-                'title': ksi['title'],
-                'category': ksi['category'],
-                'description': ksi['description'],
-                'version': ksi['version'],
-                'command_count': command_count,
-                'commands': ksi['commands'],
-                'created_date': datetime.now().isoformat(),
-                'last_updated': datetime.now().isoformat(),
-                'status': 'active'
-            }
-            
-            # Put item in table
-            table.put_item(Item=item)
-            print(f"✅ Added {ksi['ksi_id']}: {ksi['title']}")
-            
-        except Exception as e:
-            print(f"❌ Error adding {ksi['ksi_id']}: {str(e)}")
+        # Prepare DynamoDB item - use rule_id as primary key
+        item = {
+            **item_template,
+            'rule_id': ksi['ksi_id'],  # Use rule_id as primary key
+            'ksi_id': ksi['ksi_id'],   # Keep ksi_id for compatibility
+            'title': ksi['title'],
+            'category': ksi['category'],
+            'description': ksi['description'],
+            'version': ksi['version'],
+            'command_count': ksi['command_count'],
+            'commands': ksi['commands']
+        }
+        item['content_hash'] = content_hash(item)
+        if stored_hashes.get(item['rule_id']) == item['content_hash']:
+            continue
+        
+        # Serialized once here; retries of unprocessed items resend the same wire dicts
+        items.append({key: serializer.serialize(value) for key, value in item.items()})
+        changed_ksis.append(ksi)
+    
+    started = time.monotonic()
+    if atomic:
+        if items:
+            write_transaction(dynamodb_client, table_name, items)
+    else:
+        # Batches are independent, so they are written concurrently; the client is thread-safe
+        batches = [items[start:start + BATCH_WRITE_SIZE] for start in range(0, len(items), BATCH_WRITE_SIZE)]
+        with ThreadPoolExecutor(max_workers=WRITE_WORKERS) as executor:
+            list(executor.map(lambda batch: write_batch(dynamodb_client, table_name, batch), batches))
+    
+    # One summary once the writes finish, rather than a line per KSI
+    print(f"✅ Wrote {len(changed_ksis)} KSIs in {time.monotonic() - started:.2f}s: {', '.join(ksi['ksi_id'] for ksi in changed_ksis) or 'none'}")
+    print(f"⏭️  Skipped {len(all_ksis) - len(changed_ksis)} unchanged KSIs")
     
     print(f"\n🎉 Successfully populated {len(all_ksis)} KSIs!")
     print("\n📊 KSI Categories:")
     
-    # Count by category
-    categories = {}
-    for ksi in all_ksis:
-        cat = ksi['category']
-        if cat not in categories:
-            categories[cat] = 0
-        categories[cat] += 1
+    # Count by category, largest first
+    categories = Counter(ksi['category'] for ksi in all_ksis)
     
-    for cat, count in categories.items():
+    for cat, count in categories.most_common():
         print(f"   {cat}: {count} KSIs")
     
     print(f"\n🔧 Total KSIs available: {len(all_ksis)}")
     print("🎯 Your enterprise validation platform is now fully equipped!")
 
 if __name__ == "__main__":
+    # Status glyphs degrade to "?" on a non-UTF-8 console instead of raising UnicodeEncodeError
+    sys.stdout.reconfigure(errors='replace')
     populate_all_ksis()
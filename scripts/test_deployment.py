@@ -6,8 +6,35 @@ Test the deployed KSI MVP system
 import boto3
 import json
 import requests
+import subprocess
+import sys
 import time
 from datetime import datetime, timezone
+from functools import lru_cache
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+def api_session():
+    """One keep-alive session for every API call, so the tests share a TLS connection
+
+    Retry only re-sends idempotent methods by default, so the tenant POST is never repeated.
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=10, pool_maxsize=10, max_retries=Retry(total=3, backoff_factor=0.3))
+    session.mount('https://', adapter)
+    return session
+
+@lru_cache(maxsize=1)
+def terraform_outputs():
+    """`terraform output -json`, run and parsed once per process; a failed terraform raises"""
+    result = subprocess.run(['terraform', 'output', '-json'],
+                            capture_output=True, text=True, cwd='terraform', check=True)
+    return json.loads(result.stdout)
+
+@lru_cache(maxsize=1)
+def caller_account_id():
+    """The account the tests run as, from one STS client and one GetCallerIdentity per run"""
+    return boto3.client('sts').get_caller_identity()['Account']
 
 def test_deployment():
     """Test the deployed system"""
@@ -17,19 +44,18 @@ def test_deployment():
     
     # Get API Gateway URL from Terraform output
     try:
-        result = subprocess.run(['terraform', 'output', '-json'], 
-                              capture_output=True, text=True, cwd='terraform')
-        outputs = json.loads(result.stdout)
-        api_url = outputs['api_gateway_url']['value']
+        api_url = terraform_outputs()['api_gateway_url']['value']
         print(f"✅ API Gateway URL: {api_url}")
     except Exception as e:
         print(f"❌ Could not get API URL: {e}")
         return False
     
+    session = api_session()
+    
     # Test 1: Get available KSIs
     print("\n🔍 Test 1: Get available KSIs")
     try:
-        response = requests.get(f"{api_url}/api/admin/ksi-defaults")
+        response = session.get(f"{api_url}/api/admin/ksi-defaults")
         if response.status_code == 200:
             ksis = response.json()['available_ksis']
             print(f"✅ Found {len(ksis)} available KSIs")
@@ -45,15 +71,13 @@ def test_deployment():
     # Test 2: Create test tenant
     print("\n👤 Test 2: Create test tenant")
     try:
-        current_account = boto3.client('sts').get_caller_identity()['Account']
-        
         tenant_data = {
-            'account_id': current_account,
+            'account_id': caller_account_id(),
             'tenant_name': 'Test Tenant',
             'contact_email': 'test@example.com'
         }
         
-        response = requests.post(f"{api_url}/api/admin/tenants", json=tenant_data)
+        response = session.post(f"{api_url}/api/admin/tenants", json=tenant_data)
         if response.status_code == 201:
             tenant_id = response.json()['tenant_id']
             print(f"✅ Created test tenant: {tenant_id}")
@@ -71,6 +95,7 @@ def test_deployment():
     return True
 
 if __name__ == "__main__":
-    import subprocess
+    # Status glyphs degrade to "?" on a non-UTF-8 console instead of raising UnicodeEncodeError
+    sys.stdout.reconfigure(errors='replace')
     success = test_deployment()
     exit(0 if success else 1)
@@ -7,11 +7,24 @@ Safely removes corrupt/incomplete execution records while preserving quality dat
 import boto3
 import json
 import os
+import queue
+import shutil
+import tempfile
+import threading
+from collections import Counter
 from datetime import datetime, timedelta
 from decimal import Decimal
 import logging
 from typing import List, Dict, Any
-import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from boto3.dynamodb.types import TypeDeserializer
+from boto3.s3.transfer import TransferConfig
+from botocore.config import Config
+
+try:
+    import orjson  # Optional: several times faster for large backups
+except ImportError:
+    orjson = None
 
 # Setup logging
 logging.basicConfig(
@@ -25,16 +38,91 @@ REGION = 'us-gov-west-1'
 EXECUTIONS_TABLE = 'ksi-mvp-executions-dev'
 BACKUP_BUCKET = 'ksi-mvp-backups-dev'  # Optional S3 bucket for backups
 DRY_RUN = True  # Set to False to actually delete records
+SCAN_SEGMENTS = 8  # Parallel scan workers, one DynamoDB scan segment each
+DELETE_WORKERS = 8  # Parallel delete workers, each with its own batch writer
+DELETE_BATCH_SIZE = 25  # DynamoDB batch limit
+SCAN_QUEUE_SIZE = 1000  # Corrupt records buffered between the scan workers and the spool writer
+
+# A connection per worker; adaptive retries back off client-side when the table throttles
+DYNAMODB_CONFIG = Config(
+    max_pool_connections=max(SCAN_SEGMENTS, DELETE_WORKERS),
+    retries={'max_attempts': 10, 'mode': 'adaptive'},
+    tcp_keepalive=True
+)
+
+# Large backups go up as concurrent 16 MB parts instead of one single-stream PUT
+BACKUP_TRANSFER_CONFIG = TransferConfig(
+    multipart_threshold=8 * 1024 * 1024,
+    multipart_chunksize=16 * 1024 * 1024,
+    max_concurrency=16,
+    use_threads=True
+)
+
+# The S3 pool must cover every transfer thread, or part uploads queue for a connection
+S3_CONFIG = Config(
+    max_pool_connections=BACKUP_TRANSFER_CONFIG.max_request_concurrency,
+    retries={'max_attempts': 10, 'mode': 'adaptive'},
+    tcp_keepalive=True
+)
+
+# Backups stay in memory up to this size before spilling to a temp file
+BACKUP_SPOOL_MAX_BYTES = 64 * 1024 * 1024
 
 # Quality thresholds for identifying corrupt data
 QUALITY_CUTOFF_DATE = "2025-07-30T00:00:00"  # Before your CLI system was working properly
 MIN_COMMANDS_FOR_AUTOMATED = 1  # Automated KSIs should have at least 1 command
-AUTOMATED_KSI_PREFIXES = ['KSI-MLA-', 'KSI-SVC-', 'KSI-CNA-', 'KSI-IAM-']
+AUTOMATED_KSI_PREFIXES = ('KSI-MLA-', 'KSI-SVC-', 'KSI-CNA-', 'KSI-IAM-')  # A tuple, for one str.startswith call
+
+# The only attributes is_corrupt_record reads, and all the scan projects; they include the
+# (execution_id, timestamp) table key used to fetch flagged rows whole for the backup
+CHECKED_FIELDS = (
+    'timestamp', 'ksi_id', 'tenant_id', 'execution_id', 'cli_command_details',
+    'commands_executed', 'successful_commands', 'failed_commands', 'assertion', 'assertion_reason'
+)
+BATCH_GET_SIZE = 100  # BatchGetItem key limit
+
+def encode_line(obj) -> bytes:
+    """One NDJSON line, with orjson when it is installed"""
+    if orjson is not None:
+        return orjson.dumps(obj, default=str, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_APPEND_NEWLINE)
+    return json.dumps(obj, default=str).encode('utf-8') + b'\n'
+
+def decode_line(line: bytes):
+    """Parse one NDJSON line written by encode_line"""
+    return orjson.loads(line) if orjson is not None else json.loads(line)
+
+def from_attribute_value(value: dict):
+    """Convert a raw DynamoDB attribute value straight to a JSON serializable value"""
+    (type_code, raw), = value.items()
+    if type_code == 'S' or type_code == 'BOOL':
+        return raw
+    elif type_code == 'N':
+        # Integral counters dominate; only fractional values go through Decimal
+        try:
+            return int(raw)
+        except ValueError:
+            number = Decimal(raw)
+            return int(number) if number == number.to_integral_value() else float(number)
+    elif type_code == 'M':
+        return {key: from_attribute_value(item) for key, item in raw.items()}
+    elif type_code == 'L':
+        return [from_attribute_value(item) for item in raw]
+    elif type_code == 'NULL':
+        return None
+    elif type_code == 'NS':
+        return [from_attribute_value({'N': number}) for number in raw]
+    elif type_code == 'SS':
+        return list(raw)
+    return TypeDeserializer().deserialize(value)
 
 class DynamoDBCleanup:
     def __init__(self):
-        self.dynamodb = boto3.resource('dynamodb', region_name=REGION)
-        self.s3 = boto3.client('s3', region_name=REGION)
+        # One session, so credentials are resolved once for both services
+        session = boto3.Session(region_name=REGION)
+        self.dynamodb = session.resource('dynamodb', config=DYNAMODB_CONFIG)
+        # The resource's own client deserializes every item, so the scan uses a plain client
+        self.dynamodb_client = session.client('dynamodb', config=DYNAMODB_CONFIG)
+        self.s3 = session.client('s3', config=S3_CONFIG)
         self.table = self.dynamodb.Table(EXECUTIONS_TABLE)
         
         self.stats = {
@@ -46,19 +134,14 @@ class DynamoDBCleanup:
             'kept': 0
         }
         
-        self.corrupt_records = []
-        
-    def decimal_to_native(self, obj):
-        """Convert DynamoDB Decimal types to native Python types"""
-        if isinstance(obj, list):
-            return [self.decimal_to_native(item) for item in obj]
-        elif isinstance(obj, dict):
-            return {key: self.decimal_to_native(value) for key, value in obj.items()}
-        elif isinstance(obj, Decimal):
-            return int(obj) if obj % 1 == 0 else float(obj)
-        else:
-            return obj
-
+        # Corrupt records stream to this spool as NDJSON lines rather than accumulating in a list;
+        # the report only needs the issue tallies and a few samples
+        self.corrupt_spool = tempfile.SpooledTemporaryFile(max_size=BACKUP_SPOOL_MAX_BYTES, mode='w+b')
+        self.issue_counts = {'critical': Counter(), 'warning': Counter()}
+        self.sample_records = []
+        # Set when the spool writer fails, so scan workers stop queueing and wind down
+        self.stop_scan = threading.Event()
+        
     def is_corrupt_record(self, record: Dict[str, Any]) -> Dict[str, List[str]]:
         """
         Identify if a record is corrupt and why
@@ -88,7 +171,7 @@ class DynamoDBCleanup:
         ksi_id = record.get('ksi_id', '')
         
         # Automated KSIs should have CLI commands
-        is_automated_ksi = any(ksi_id.startswith(prefix) for prefix in AUTOMATED_KSI_PREFIXES)
+        is_automated_ksi = ksi_id.startswith(AUTOMATED_KSI_PREFIXES)
         
         if is_automated_ksi and commands_executed > 0:
             if not cli_commands or len(cli_commands) == 0:
@@ -126,150 +209,259 @@ class DynamoDBCleanup:
         
         return issues
 
-    def scan_for_corrupt_records(self) -> List[Dict[str, Any]]:
-        """Scan the entire table for corrupt records"""
-        logger.info(f"🔍 Scanning {EXECUTIONS_TABLE} for corrupt records...")
-        
-        corrupt_records = []
-        last_evaluated_key = None
-        
-        while True:
-            scan_kwargs = {
-                'TableName': EXECUTIONS_TABLE,
-                'Select': 'ALL_ATTRIBUTES'
-            }
-            
-            if last_evaluated_key:
-                scan_kwargs['ExclusiveStartKey'] = last_evaluated_key
-            
-            try:
-                response = self.table.scan(**scan_kwargs)
-                items = response.get('Items', [])
-                
-                for item in items:
-                    self.stats['total_scanned'] += 1
-                    
-                    # Convert Decimal types for JSON serialization
-                    clean_item = self.decimal_to_native(item)
+    def queue_full_records(self, flagged: Dict[tuple, Dict[str, List[str]]], corrupt_queue: queue.Queue) -> int:
+        """Fetch flagged rows whole with one BatchGetItem and queue them with their issues
+
+        flagged maps (execution_id, timestamp) to the row's issues. Rows deleted since the scan
+        are not returned and so are neither backed up nor deleted. Returns how many were queued.
+        """
+        queued = 0
+        request_items = {EXECUTIONS_TABLE: {
+            'Keys': [{'execution_id': {'S': execution_id}, 'timestamp': {'S': timestamp}} for execution_id, timestamp in flagged],
+            'ConsistentRead': True
+        }}
+        while request_items and not self.stop_scan.is_set():
+            response = self.dynamodb_client.batch_get_item(RequestItems=request_items)
+            for raw_item in response.get('Responses', {}).get(EXECUTIONS_TABLE, []):
+                # Only records kept for the backup are fully converted for JSON serialization
+                record = {key: from_attribute_value(value) for key, value in raw_item.items()}
+                corrupt_queue.put({
+                    'record': record,
+                    'issues': flagged[(record['execution_id'], record['timestamp'])]
+                })
+                queued += 1
+            request_items = response.get('UnprocessedKeys')
+        return queued
+
+    def scan_segment(self, segment: int, corrupt_queue: queue.Queue) -> Dict[str, int]:
+        """Scan one parallel-scan segment, queueing its corrupt records and returning its counts"""
+        result = {'scanned': 0, 'corrupt': 0, 'kept': 0, 'errors': 0}
+        
+        # Rows arrive as raw attribute values, projected to the checked fields ("timestamp" is reserved)
+        projection_names = {f'#p{index}': field for index, field in enumerate(CHECKED_FIELDS)}
+        pages = self.dynamodb_client.get_paginator('scan').paginate(
+            TableName=EXECUTIONS_TABLE,
+            ProjectionExpression=', '.join(projection_names),
+            ExpressionAttributeNames=projection_names,
+            Segment=segment,
+            TotalSegments=SCAN_SEGMENTS
+        )
+        
+        try:
+            flagged = {}
+            for page in pages:
+                if self.stop_scan.is_set():
+                    break
+                for raw_item in page.get('Items', []):
+                    result['scanned'] += 1
                     
-                    # Check if record is corrupt
-                    corruption_issues = self.is_corrupt_record(clean_item)
+                    # Check if record is corrupt from just the fields the checks read
+                    checked_fields = {field: from_attribute_value(value) for field, value in raw_item.items()}
+                    corruption_issues = self.is_corrupt_record(checked_fields)
                     
                     # If any critical or warning issues found, mark as corrupt
                     if corruption_issues['critical'] or corruption_issues['warning']:
-                        corrupt_records.append({
-                            'record': clean_item,
-                            'issues': corruption_issues
-                        })
-                        self.stats['corrupt_found'] += 1
-                        
-                        if self.stats['corrupt_found'] % 10 == 0:
-                            logger.info(f"Found {self.stats['corrupt_found']} corrupt records so far...")
+                        flagged[(checked_fields['execution_id'], checked_fields['timestamp'])] = corruption_issues
+                        if len(flagged) == BATCH_GET_SIZE:
+                            result['corrupt'] += self.queue_full_records(flagged, corrupt_queue)
+                            flagged = {}
                     else:
-                        self.stats['kept'] += 1
-                
-                # Check if there are more items to scan
-                last_evaluated_key = response.get('LastEvaluatedKey')
-                if not last_evaluated_key:
-                    break
+                        result['kept'] += 1
+            
+            if flagged:
+                result['corrupt'] += self.queue_full_records(flagged, corrupt_queue)
                     
-            except Exception as e:
-                logger.error(f"Error scanning table: {e}")
-                self.stats['errors'] += 1
-                break
+        except Exception as e:
+            logger.error(f"Error scanning segment {segment}: {e}")
+            result['errors'] += 1
+        finally:
+            # One end-of-segment marker per worker tells the spool writer when to stop
+            corrupt_queue.put(None)
+        
+        logger.info(f"Segment {segment}: {result['scanned']} scanned, {result['corrupt']} corrupt")
+        return result
+
+    def spool_corrupt_record(self, corrupt_item: Dict[str, Any]):
+        """Append one corrupt record to the spool and fold it into the report tallies"""
+        self.corrupt_spool.write(encode_line(corrupt_item))
+        for severity, counts in self.issue_counts.items():
+            counts.update(corrupt_item['issues'][severity])
+        if len(self.sample_records) < 3:
+            self.sample_records.append(corrupt_item)
+        self.stats['corrupt_found'] += 1
+
+    def spooled_records(self):
+        """Corrupt records from the spool, one at a time"""
+        self.corrupt_spool.seek(0)
+        for line in self.corrupt_spool:
+            yield decode_line(line)
+
+    def scan_for_corrupt_records(self) -> int:
+        """Scan the entire table for corrupt records, SCAN_SEGMENTS segments in parallel
+
+        Scan workers feed a bounded queue that this thread drains into the spool, so only
+        SCAN_QUEUE_SIZE corrupt records are ever held in memory. Returns the corrupt count.
+        """
+        logger.info(f"🔍 Scanning {EXECUTIONS_TABLE} for corrupt records ({SCAN_SEGMENTS} segments)...")
+        
+        corrupt_queue = queue.Queue(maxsize=SCAN_QUEUE_SIZE)
+        with ThreadPoolExecutor(max_workers=SCAN_SEGMENTS) as executor:
+            futures = [executor.submit(self.scan_segment, segment, corrupt_queue) for segment in range(SCAN_SEGMENTS)]
+            
+            finished_segments = 0
+            try:
+                while finished_segments < SCAN_SEGMENTS:
+                    corrupt_item = corrupt_queue.get()
+                    if corrupt_item is None:
+                        finished_segments += 1
+                    else:
+                        self.spool_corrupt_record(corrupt_item)
+            except BaseException:
+                # Workers blocked on the full queue would hold the executor open forever, so
+                # stop them and keep draining until every segment has put its end marker
+                self.stop_scan.set()
+                while finished_segments < SCAN_SEGMENTS:
+                    if corrupt_queue.get() is None:
+                        finished_segments += 1
+                raise
+        
+        # Each worker returns its own counts, merged here, so no counters are shared across threads
+        for future in futures:
+            result = future.result()
+            self.stats['total_scanned'] += result['scanned']
+            self.stats['kept'] += result['kept']
+            self.stats['errors'] += result['errors']
         
         logger.info(f"✅ Scan complete: {self.stats['total_scanned']} total, {self.stats['corrupt_found']} corrupt")
-        return corrupt_records
+        return self.stats['corrupt_found']
 
-    def backup_corrupt_records(self, corrupt_records: List[Dict[str, Any]]) -> bool:
-        """Backup corrupt records to S3 before deletion"""
-        if not corrupt_records:
+    def backup_corrupt_records(self) -> bool:
+        """Backup the spooled corrupt records to S3 before deletion
+
+        The backup is newline-delimited JSON: a header line, then the spool's one line per
+        corrupt record, copied through a spooled temp file rather than built as one string.
+        """
+        corrupt_count = self.stats['corrupt_found']
+        if not corrupt_count:
             return True
             
-        logger.info(f"💾 Backing up {len(corrupt_records)} corrupt records...")
+        logger.info(f"💾 Backing up {corrupt_count} corrupt records...")
         
-        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-        backup_key = f"database_cleanup/corrupt_records_backup_{timestamp}.json"
+        # One clock read, so the backup's key and header name the same moment
+        backed_up_at = datetime.now()
+        timestamp = backed_up_at.strftime('%Y%m%d_%H%M%S')
+        backup_key = f"database_cleanup/corrupt_records_backup_{timestamp}.jsonl"
         
-        backup_data = {
-            'backup_timestamp': datetime.now().isoformat(),
+        backup_header = {
+            'backup_timestamp': backed_up_at.isoformat(),
             'table_name': EXECUTIONS_TABLE,
             'cleanup_reason': 'Data quality cleanup - corrupt/incomplete records',
-            'total_records': len(corrupt_records),
-            'records': corrupt_records
+            'total_records': corrupt_count
         }
         
         try:
-            # Try to save to S3 first
-            try:
-                backup_json = json.dumps(backup_data, indent=2, default=str)
-                self.s3.put_object(
-                    Bucket=BACKUP_BUCKET,
-                    Key=backup_key,
-                    Body=backup_json,
-                    ContentType='application/json'
-                )
-                logger.info(f"✅ Backup saved to S3: s3://{BACKUP_BUCKET}/{backup_key}")
-                self.stats['backed_up'] = len(corrupt_records)
-                return True
-                
-            except Exception as s3_error:
-                logger.warning(f"S3 backup failed: {s3_error}")
+            with tempfile.SpooledTemporaryFile(max_size=BACKUP_SPOOL_MAX_BYTES, mode='w+b') as backup_file:
+                backup_file.write(encode_line(backup_header))
+                self.corrupt_spool.seek(0)
+                shutil.copyfileobj(self.corrupt_spool, backup_file)
                 
-                # Fallback to local file
-                local_backup_file = f"corrupt_records_backup_{timestamp}.json"
-                with open(local_backup_file, 'w') as f:
-                    json.dump(backup_data, f, indent=2, default=str)
-                logger.info(f"✅ Backup saved locally: {local_backup_file}")
-                self.stats['backed_up'] = len(corrupt_records)
-                return True
+                # Try to save to S3 first
+                try:
+                    backup_file.seek(0)
+                    self.s3.upload_fileobj(
+                        backup_file,
+                        BACKUP_BUCKET,
+                        backup_key,
+                        ExtraArgs={'ContentType': 'application/x-ndjson'},
+                        Config=BACKUP_TRANSFER_CONFIG
+                    )
+                    logger.info(f"✅ Backup saved to S3: s3://{BACKUP_BUCKET}/{backup_key}")
+                    self.stats['backed_up'] = corrupt_count
+                    return True
+                    
+                except Exception as s3_error:
+                    logger.warning(f"S3 backup failed: {s3_error}")
+                    
+                    # Fallback to local file
+                    local_backup_file = f"corrupt_records_backup_{timestamp}.jsonl"
+                    backup_file.seek(0)
+                    with open(local_backup_file, 'wb') as f:
+                        shutil.copyfileobj(backup_file, f)
+                    logger.info(f"✅ Backup saved locally: {local_backup_file}")
+                    self.stats['backed_up'] = corrupt_count
+                    return True
                 
         except Exception as e:
             logger.error(f"❌ Backup failed: {e}")
             return False
 
-    def delete_corrupt_records(self, corrupt_records: List[Dict[str, Any]]) -> bool:
-        """Safely delete corrupt records from DynamoDB"""
-        if not corrupt_records or DRY_RUN:
+    def delete_record_batch(self, records: List[Dict[str, Any]]) -> Dict[str, int]:
+        """Delete one batch of records on its own batch writer, returning deleted and error counts"""
+        try:
+            # Keyed on the table's primary key; duplicate keys within a batch collapse into one delete
+            with self.table.batch_writer(overwrite_by_pkeys=['execution_id', 'timestamp']) as batch_writer:
+                for record in records:
+                    batch_writer.delete_item(Key={
+                        'execution_id': record['execution_id'],
+                        'timestamp': record['timestamp']
+                    })
+            return {'deleted': len(records), 'errors': 0}
+            
+        except Exception as e:
+            logger.error(f"Error deleting batch of {len(records)} records: {e}")
+            return {'deleted': 0, 'errors': 1}
+
+    def delete_corrupt_records(self) -> bool:
+        """Safely delete the spooled corrupt records from DynamoDB, DELETE_WORKERS batches in parallel"""
+        corrupt_count = self.stats['corrupt_found']
+        if not corrupt_count or DRY_RUN:
             if DRY_RUN:
-                logger.info(f"🧪 DRY RUN: Would delete {len(corrupt_records)} corrupt records")
+                logger.info(f"🧪 DRY RUN: Would delete {corrupt_count} corrupt records")
                 return True
             return True
         
-        logger.info(f"🗑️ Deleting {len(corrupt_records)} corrupt records...")
+        logger.info(f"🗑️ Deleting {corrupt_count} corrupt records...")
         
         deleted_count = 0
-        batch_size = 25  # DynamoDB batch limit
         
-        for i in range(0, len(corrupt_records), batch_size):
-            batch = corrupt_records[i:i + batch_size]
-            
-            try:
-                with self.table.batch_writer() as batch_writer:
-                    for corrupt_item in batch:
-                        record = corrupt_item['record']
-                        
-                        # Delete using the primary key
-                        delete_key = {
-                            'tenant_id': record['tenant_id'],
-                            'execution_id': record.get('execution_id', record.get('ksi_id', 'unknown'))
-                        }
-                        
-                        batch_writer.delete_item(Key=delete_key)
-                        deleted_count += 1
+        def collect(done):
+            nonlocal deleted_count
+            for future in done:
+                result = future.result()
+                deleted_count += result['deleted']
+                self.stats['errors'] += result['errors']
+        
+        # Batches are read back from the spool and handed out as workers free up, so at most
+        # 2 * DELETE_WORKERS batches are in memory; throttling is absorbed by adaptive retries
+        with ThreadPoolExecutor(max_workers=DELETE_WORKERS) as executor:
+            pending = set()
+            batch = []
+            for corrupt_item in self.spooled_records():
+                record = corrupt_item['record']
                 
-                logger.info(f"Deleted batch {i//batch_size + 1}: {len(batch)} records")
-                time.sleep(0.1)  # Small delay to avoid throttling
+                # The table key is (execution_id, timestamp); records missing either cannot be addressed
+                if not (record.get('execution_id') and record.get('timestamp')):
+                    logger.warning(f"Skipping record without a primary key: {record.get('ksi_id', 'MISSING')}")
+                    self.stats['errors'] += 1
+                    continue
                 
-            except Exception as e:
-                logger.error(f"Error deleting batch: {e}")
-                self.stats['errors'] += 1
+                batch.append(record)
+                if len(batch) == DELETE_BATCH_SIZE:
+                    pending.add(executor.submit(self.delete_record_batch, batch))
+                    batch = []
+                    if len(pending) >= 2 * DELETE_WORKERS:
+                        done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                        collect(done)
+            
+            if batch:
+                pending.add(executor.submit(self.delete_record_batch, batch))
+            collect(wait(pending).done)
         
         self.stats['deleted'] = deleted_count
         logger.info(f"✅ Successfully deleted {deleted_count} corrupt records")
         return True
 
-    def print_cleanup_report(self, corrupt_records: List[Dict[str, Any]]):
+    def print_cleanup_report(self):
         """Print detailed cleanup report"""
         print("\n" + "="*80)
         print("🧹 DATABASE CLEANUP REPORT")
@@ -283,36 +475,27 @@ class DynamoDBCleanup:
         print(f"   Records deleted:       {self.stats['deleted']:,}")
         print(f"   Errors encountered:    {self.stats['errors']:,}")
         
-        if corrupt_records:
+        if self.stats['corrupt_found']:
             print(f"\n🔍 CORRUPTION ANALYSIS:")
             
-            # Count corruption types
-            critical_issues = {}
-            warning_issues = {}
-            
-            for corrupt_item in corrupt_records:
-                issues = corrupt_item['issues']
-                
-                for issue in issues.get('critical', []):
-                    critical_issues[issue] = critical_issues.get(issue, 0) + 1
-                    
-                for issue in issues.get('warning', []):
-                    warning_issues[issue] = warning_issues.get(issue, 0) + 1
+            # Corruption types were tallied as records were spooled
+            critical_issues = self.issue_counts['critical']
+            warning_issues = self.issue_counts['warning']
             
             if critical_issues:
                 print(f"\n   🚨 CRITICAL ISSUES:")
-                for issue, count in sorted(critical_issues.items(), key=lambda x: x[1], reverse=True):
+                for issue, count in critical_issues.most_common():
                     print(f"      • {issue}: {count} records")
             
             if warning_issues:
                 print(f"\n   ⚠️  WARNING ISSUES:")
-                for issue, count in sorted(warning_issues.items(), key=lambda x: x[1], reverse=True):
+                for issue, count in warning_issues.most_common():
                     print(f"      • {issue}: {count} records")
         
         # Show sample corrupt records
-        if corrupt_records:
+        if self.sample_records:
             print(f"\n📋 SAMPLE CORRUPT RECORDS (first 3):")
-            for i, corrupt_item in enumerate(corrupt_records[:3]):
+            for i, corrupt_item in enumerate(self.sample_records):
                 record = corrupt_item['record']
                 issues = corrupt_item['issues']
                 
@@ -345,22 +528,22 @@ def main():
     
     try:
         # Step 1: Scan for corrupt records
-        corrupt_records = cleanup.scan_for_corrupt_records()
+        corrupt_count = cleanup.scan_for_corrupt_records()
         
-        if not corrupt_records:
+        if not corrupt_count:
             print("🎉 No corrupt records found! Database is clean.")
             return
         
         # Step 2: Backup corrupt records
-        if not cleanup.backup_corrupt_records(corrupt_records):
+        if not cleanup.backup_corrupt_records():
             print("❌ Backup failed! Stopping cleanup for safety.")
             return
         
         # Step 3: Delete corrupt records
-        cleanup.delete_corrupt_records(corrupt_records)
+        cleanup.delete_corrupt_records()
         
         # Step 4: Print report
-        cleanup.print_cleanup_report(corrupt_records)
+        cleanup.print_cleanup_report()
         
         if not DRY_RUN:
             print(f"\n🎉 Cleanup complete! Your dashboard should now show only quality data.")
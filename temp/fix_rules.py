@@ -6,6 +6,7 @@ Focus on 6 high-impact KSIs with existing CLI commands
 
 import boto3
 import json
+from boto3.dynamodb.conditions import Key
 
 # Configuration
 AWS_REGION = "us-gov-west-1"
@@ -242,8 +243,21 @@ PRIORITY_KSI_VALIDATION_STEPS = {
     ]
 }
 
+def find_ksi_rules(table, ksi_id):
+    """The rule for a KSI from the ksi-version-index GSI (projects ALL), newest version first"""
+    response = table.query(
+        IndexName='ksi-version-index',
+        KeyConditionExpression=Key('ksi_id').eq(ksi_id),
+        ScanIndexForward=False,
+        Limit=1
+    )
+    return response.get('Items', [])
+
 def add_priority_ksi_validation_steps():
-    """Add validation steps to priority KSIs for MVP demo"""
+    """Add validation steps to priority KSIs for MVP demo
+
+    Returns ksi_id -> rule_id for the rules that were saved.
+    """
     
     dynamodb = boto3.resource('dynamodb', region_name=AWS_REGION)
     table = dynamodb.Table(VALIDATION_RULES_TABLE)
@@ -251,17 +265,13 @@ def add_priority_ksi_validation_steps():
     print("🚀 Adding priority KSI validation steps for MVP")
     print("=" * 50)
     
+    updated_rules = []
     for ksi_id, validation_steps in PRIORITY_KSI_VALIDATION_STEPS.items():
         print(f"\n📋 Updating {ksi_id}...")
         
         try:
             # Get existing rule
-            response = table.scan(
-                FilterExpression="ksi_id = :ksi_id",
-                ExpressionAttributeValues={":ksi_id": ksi_id}
-            )
-            
-            rules = response.get('Items', [])
+            rules = find_ksi_rules(table, ksi_id)
             if not rules:
                 print(f"  ❌ KSI rule {ksi_id} not found in DynamoDB")
                 continue
@@ -270,20 +280,29 @@ def add_priority_ksi_validation_steps():
             
             # Update validation steps
             rule['validation_steps'] = validation_steps
+            rule['validation_steps_count'] = len(validation_steps)
+            rule['has_cli_steps'] = any('service' in step and 'action' in step for step in validation_steps)
             rule['automation_type'] = 'fully_automated'
+            updated_rules.append(rule)
             
-            # Save updated rule
-            table.put_item(Item=rule)
-            
-            print(f"  ✅ Added {len(validation_steps)} validation steps")
+            print(f"  ✅ Prepared {len(validation_steps)} validation steps")
             for step in validation_steps:
                 print(f"    - {step['cli_command']}")
             
         except Exception as e:
             print(f"  ❌ Error updating {ksi_id}: {str(e)}")
     
+    # Save every updated rule in one BatchWriteItem; the writer retries unprocessed items
+    try:
+        with table.batch_writer(overwrite_by_pkeys=['rule_id']) as writer:
+            for rule in updated_rules:
+                writer.put_item(Item=rule)
+    except Exception as e:
+        print(f"\n❌ Error saving updated rules: {str(e)}")
+        return {}
+    
     print("\n" + "=" * 50)
-    print("🎉 Priority KSI validation steps added successfully!")
+    print(f"🎉 Priority KSI validation steps added successfully! ({len(updated_rules)} rules saved)")
     print("\nMVP KSIs now fully automated:")
     print("✅ KSI-MLA-01: SIEM/Centralized Logging")
     print("✅ KSI-MLA-02: Log Review & Analysis") 
@@ -295,41 +314,48 @@ def add_priority_ksi_validation_steps():
     print("✅ KSI-SVC-05: API Security Configuration")
     print("✅ KSI-IAM-06: Automated Response")
     print("\n🎯 Total: 9 fully automated KSIs for MVP demo!")
+    
+    return {rule['ksi_id']: rule['rule_id'] for rule in updated_rules}
 
-def verify_priority_ksis():
+def verify_priority_ksis(rule_ids_by_ksi):
     """Verify the priority KSIs were updated correctly"""
     
     dynamodb = boto3.resource('dynamodb', region_name=AWS_REGION)
-    table = dynamodb.Table(VALIDATION_RULES_TABLE)
     
     print("\n🔍 Verifying priority KSI updates...")
     print("=" * 40)
     
+    # One consistent BatchGetItem by rule_id reads the writes back; the GSI may still lag them
+    rules_by_ksi = {}
+    try:
+        request_items = {VALIDATION_RULES_TABLE: {
+            'Keys': [{'rule_id': rule_id} for rule_id in rule_ids_by_ksi.values()],
+            'ConsistentRead': True
+        }} if rule_ids_by_ksi else None
+        while request_items:
+            response = dynamodb.batch_get_item(RequestItems=request_items)
+            for rule in response.get('Responses', {}).get(VALIDATION_RULES_TABLE, []):
+                rules_by_ksi[rule['ksi_id']] = rule
+            request_items = response.get('UnprocessedKeys')
+    except Exception as e:
+        print(f"❌ Error reading rules back: {str(e)}")
+        return
+    
     for ksi_id in PRIORITY_KSI_VALIDATION_STEPS.keys():
-        try:
-            response = table.scan(
-                FilterExpression="ksi_id = :ksi_id",
-                ExpressionAttributeValues={":ksi_id": ksi_id}
-            )
+        rule = rules_by_ksi.get(ksi_id)
+        if rule:
+            automation_type = rule.get('automation_type')
+            validation_steps = rule.get('validation_steps', [])
             
-            rules = response.get('Items', [])
-            if rules:
-                rule = rules[0]
-                automation_type = rule.get('automation_type')
-                validation_steps = rule.get('validation_steps', [])
-                
-                print(f"📋 {ksi_id}: {automation_type}")
-                print(f"  Validation steps: {len(validation_steps)}")
-                
-                if automation_type == 'fully_automated' and len(validation_steps) > 0:
-                    print(f"  ✅ Ready for automation")
-                else:
-                    print(f"  ❌ Not ready - check configuration")
+            print(f"📋 {ksi_id}: {automation_type}")
+            print(f"  Validation steps: {len(validation_steps)}")
+            
+            if automation_type == 'fully_automated' and len(validation_steps) > 0:
+                print(f"  ✅ Ready for automation")
             else:
-                print(f"❌ {ksi_id}: Not found")
-                
-        except Exception as e:
-            print(f"❌ {ksi_id}: Error - {str(e)}")
+                print(f"  ❌ Not ready - check configuration")
+        else:
+            print(f"❌ {ksi_id}: Not found")
 
 def main():
     """Main function to add priority KSI validation steps"""
@@ -340,10 +366,10 @@ def main():
     print("Focus: Network, Service, and IAM security automation\n")
     
     # Add priority KSI validation steps
-    add_priority_ksi_validation_steps()
+    rule_ids_by_ksi = add_priority_ksi_validation_steps()
     
     # Verify updates
-    verify_priority_ksis()
+    verify_priority_ksis(rule_ids_by_ksi)
     
     print("\n🚀 NEXT STEPS:")
     print("1. Test validation execution with these 9 automated KSIs")
@@ -80,6 +80,11 @@ resource "aws_dynamodb_table" "executions" {
     type = "S"
   }
   
+  attribute {
+    name = "record_type"
+    type = "S"
+  }
+  
   global_secondary_index {
     name     = "tenant-timestamp-index"
     hash_key = "tenant_id"
@@ -87,6 +92,13 @@ resource "aws_dynamodb_table" "executions" {
     projection_type = "ALL"
   }
   
+  global_secondary_index {
+    name     = "record-type-timestamp-index"
+    hash_key = "record_type"
+    range_key = "timestamp"
+    projection_type = "ALL"
+  }
+  
   point_in_time_recovery {
     enabled = true
   }
@@ -238,9 +250,12 @@ resource "aws_iam_policy" "lambda_policy" {
         Action = [
           "dynamodb:Query",
           "dynamodb:GetItem",
+          "dynamodb:BatchGetItem",
           "dynamodb:PutItem",
           "dynamodb:UpdateItem",
-          "dynamodb:Scan"
+          "dynamodb:BatchWriteItem",
+          "dynamodb:Scan",
+          "dynamodb:DescribeTable"
         ]
         Resource = [
           aws_dynamodb_table.tenants.arn,
@@ -291,6 +306,13 @@ resource "aws_iam_role_policy_attachment" "lambda_policy_attachment" {
 # LAMBDA FUNCTION
 # ============================================================================
 
+resource "aws_lambda_layer_version" "dependencies" {
+  filename            = "ksi_dependencies_layer.zip"
+  layer_name          = "${var.project_name}-dependencies-${var.environment}"
+  compatible_runtimes = ["python3.9"]
+  source_code_hash    = filebase64sha256("ksi_dependencies_layer.zip")
+}
+
 resource "aws_lambda_function" "ksi_validator" {
   filename         = "ksi_validator.zip"
   function_name    = "${var.project_name}-validator-${var.environment}"
@@ -299,6 +321,7 @@ resource "aws_lambda_function" "ksi_validator" {
   runtime         = "python3.9"
   timeout         = 300
   memory_size     = 512
+  layers          = [aws_lambda_layer_version.dependencies.arn]
   
   environment {
     variables = {